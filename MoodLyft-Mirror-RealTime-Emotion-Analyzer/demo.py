@@ -11,7 +11,7 @@ import random
 import math
 from typing import Dict, List
 from main import MoodLyftMirror
-from src.config import COLOR_MAP, EMOJIS
+from src.config import COLOR_MAP, EMOJIS, auto_configure
 
 class FeatureDemo:
     """Demonstrates specific features of the enhanced application"""
@@ -293,6 +293,7 @@ class FeatureDemo:
                 frame = cv2.flip(frame, 1)
                 
                 # Run current demo
+                self.detector.ui_elements.animation_manager.tick()
                 demo_name, demo_func = self.demo_features[self.current_demo]
                 processed_frame = demo_func(frame)
                 
@@ -349,6 +350,7 @@ Usage:
         """)
         return
     
+    auto_configure()
     demo = FeatureDemo()
     demo.run_demo()
 
@@ -15,10 +15,10 @@ from src.ui_elements import ModernUIElements
 from src.tts_manager import TTSManager, EmotionFeedbackManager
 from src.utils import load_fonts, get_system_info, get_border_style_for_emotion
 from src.config import (
-    COLOR_MAP, EMOJIS, EMOTION_SKIP_FRAMES,
+    COLOR_MAP_T, EMOJIS, EMOTION_IDS, EMOTION_SKIP_FRAMES,
     DEFAULT_CAMERA_WIDTH, DEFAULT_CAMERA_HEIGHT, DEFAULT_FPS,
     UI_PANEL_HEIGHT, UI_PANEL_PADDING, UI_ROUNDED_CORNER_RADIUS,
-    VIDEOS_DIR, SCREENSHOTS_DIR
+    VIDEOS_DIR, SCREENSHOTS_DIR, auto_configure, ensure_output_dirs
 )
 
 ########################################
@@ -50,7 +50,7 @@ class MoodLyftMirror:
         # Performance tracking
         self.frame_skip_count = 0
         self.last_emotion_result = None
-        self.prev_time = time.time()
+        self.prev_time = time.monotonic()
         self.fps_history = deque(maxlen=30)
         
         # State tracking
@@ -66,22 +66,31 @@ class MoodLyftMirror:
         """Process a single frame and return the enhanced result"""
         h, w = frame.shape[:2]
         overlay = frame.copy()
+        now_ns = time.monotonic_ns()
+        self.feedback_manager.tick(now_ns)
+        self.ui_elements.animation_manager.tick(now_ns * 1e-9)
         
-        # Emotion detection with frame skipping for performance
+        # Emotion detection with frame skipping for performance; the threaded
+        # detector never blocks, so it is fed and polled on every frame
         emotion_data = {"faces": [], "dominant_emotion": None}
         
-        if self.frame_skip_count % EMOTION_SKIP_FRAMES == 0:
+        if self.emotion_analyzer.threaded or self.frame_skip_count % EMOTION_SKIP_FRAMES == 0:
             try:
-                faces_data, top_emotion = self.emotion_analyzer.analyze_frame(frame)
-                self.last_emotion_result = (faces_data, top_emotion)
+                result = self.emotion_analyzer.analyze_frame(frame)
+                if result is not None:
+                    self.last_emotion_result = result
             except Exception as e:
                 logging.error(f"Emotion detection error: {e}")
-                faces_data, top_emotion = [], {}
+                result = ([], {})
         else:
-            faces_data, top_emotion = self.last_emotion_result or ([], {})
+            result = self.last_emotion_result
         
         self.frame_skip_count += 1
         
+        # Before the first detection finishes there is nothing to draw, and that is not "no face"
+        detection_ready = result is not None
+        faces_data, top_emotion = result or ([], {})
+        
         if faces_data:
             emotion_data["faces"] = faces_data
             
@@ -92,7 +101,7 @@ class MoodLyftMirror:
             # Handle dominant emotion
             if top_emotion:
                 emotion_data["dominant_emotion"] = top_emotion
-                self._handle_emotion_feedback(top_emotion)
+                self._handle_emotion_feedback(top_emotion, now_ns)
                 
                 # Update emotion history
                 if isinstance(top_emotion, dict) and top_emotion:
@@ -102,7 +111,7 @@ class MoodLyftMirror:
                         'emotion': emotion,
                         'confidence': confidence
                     })
-        else:
+        elif detection_ready:
             self._handle_no_face_detected()
         
         # Add UI elements
@@ -118,7 +127,8 @@ class MoodLyftMirror:
         confidence = emotions[best_emotion]
         
         # Get color scheme for emotion
-        color_scheme = COLOR_MAP.get(best_emotion, COLOR_MAP['neutral'])
+        emotion_id = face_data.get("emotion_id", EMOTION_IDS.get(best_emotion, EMOTION_IDS['neutral']))
+        color_scheme = COLOR_MAP_T[emotion_id]
         primary_color = color_scheme['primary']
         
         # Smooth color transition
@@ -153,20 +163,19 @@ class MoodLyftMirror:
             overlay, x, y + h_box + 10, w_box, 8, confidence, self.current_emotion_color
         )
     
-    def _handle_emotion_feedback(self, top_emotion_data: Dict) -> None:
+    def _handle_emotion_feedback(self, top_emotion_data: Dict, now_ns: int) -> None:
         """Handle emotion feedback through TTS"""
         try:
-            logging.debug(f"Handling emotion feedback: {top_emotion_data}")
+            logging.debug("Handling emotion feedback: %s", top_emotion_data)
             if isinstance(top_emotion_data, dict) and top_emotion_data:
                 emotion, confidence = list(top_emotion_data.items())[0]
-                logging.debug(f"Processing emotion: {emotion} with confidence: {confidence}")
+                logging.debug("Processing emotion: %s with confidence: %s", emotion, confidence)
                 
                 # Update emotion tracking and give compliment if appropriate
-                self.feedback_manager.update_emotion_tracking(emotion, confidence)
-                compliment = self.feedback_manager.give_compliment(emotion, confidence)
+                compliment = self.feedback_manager.process_frame(emotion, confidence, now_ns)
                 if compliment:
                     self.last_compliment = compliment
-                    logging.debug(f"Compliment set: {compliment}")
+                    logging.debug("Compliment set: %s", compliment)
                 
                 logging.debug("Emotion feedback handling completed")
         except Exception as e:
@@ -186,7 +195,7 @@ class MoodLyftMirror:
         h, w = overlay.shape[:2]
         
         # Calculate FPS
-        current_time = time.time()
+        current_time = time.monotonic()
         dt = current_time - self.prev_time
         fps = 1.0 / dt if dt > 0 else 0
         self.fps_history.append(fps)
@@ -218,7 +227,7 @@ class MoodLyftMirror:
             self.ui_elements.draw_enhanced_compliment(overlay, w, h, self.last_compliment, self.fonts)
         
         # Final blend
-        return cv2.addWeighted(overlay, 0.9, original_frame, 0.1, 0)
+        return self.ui_elements.add_weighted(overlay, 0.9, original_frame, 0.1)
     
     def setup_camera(self) -> cv2.VideoCapture:
         """Setup and configure camera"""
@@ -244,6 +253,7 @@ class MoodLyftMirror:
     def setup_video_recording(self) -> cv2.VideoWriter:
         """Setup video recording if possible"""
         try:
+            ensure_output_dirs()
             fourcc = cv2.VideoWriter_fourcc(*"mp4v")
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             video_path = os.path.join(VIDEOS_DIR, f"emotion_capture_{timestamp}.mp4")
@@ -266,6 +276,7 @@ class MoodLyftMirror:
     def _take_screenshot(self, frame: np.ndarray):
         """Take a screenshot"""
         try:
+            ensure_output_dirs()
             screenshot_name = f"screenshot_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
             screenshot_path = os.path.join(SCREENSHOTS_DIR, screenshot_name)
             cv2.imwrite(screenshot_path, frame)
@@ -299,6 +310,10 @@ class MoodLyftMirror:
             cv2.destroyAllWindows()
         except:
             pass
+        try:
+            self.emotion_analyzer.stop()
+        except:
+            pass
         try:
             self.tts_manager.stop()
         except:
@@ -312,6 +327,9 @@ def main():
     logging.info("Starting MoodLyft Mirror with modular architecture")
     logging.info("Controls: 'q' to quit, 's' for screenshot, 'r' to reset history")
     
+    # Apply the hardware preset matching this machine
+    auto_configure()
+    
     # Initialize application
     logging.info("Initializing MoodLyft Mirror application...")
     app = MoodLyftMirror()
@@ -7,11 +7,26 @@ Smart venv management - preserves existing working environments
 
 import os
 import sys
+import json
 import subprocess
 import platform
 import shutil
+import threading
+from collections import deque
 from pathlib import Path
 
+# Platform details, looked up once instead of on every helper call
+_SYSTEM_NAME = platform.system()
+_SYSTEM = _SYSTEM_NAME.lower()
+_ARCHITECTURE = platform.architecture()[0]
+
+# Persistent pip cache that survives venv recreation
+PIP_CACHE_DIR = os.path.expanduser("~/.cache/moodlyft-pip")
+# Packages that always publish wheels - never build these from source
+BINARY_ONLY_PACKAGES = ["numpy", "opencv-python", "pillow"]
+# Local wheelhouse pre-populated while pip is being upgraded (kept out of the project tree)
+WHEELHOUSE_DIR = os.path.join(PIP_CACHE_DIR, "wheelhouse")
+
 def print_banner():
     """Print welcome banner"""
     banner = """
@@ -29,9 +44,9 @@ def get_system_info():
     print("🖥️  Analyzing system capabilities...")
     
     system_info = {
-        "os": platform.system(),
+        "os": _SYSTEM_NAME,
         "os_version": platform.release(),
-        "architecture": platform.architecture()[0],
+        "architecture": _ARCHITECTURE,
         "processor": platform.processor() or "Unknown",
         "python_version": sys.version,
         "python_executable": sys.executable,
@@ -77,10 +92,9 @@ def check_python_version():
 
 def get_venv_info():
     """Get virtual environment paths and commands for current system"""
-    system = platform.system().lower()
     venv_name = "moodlyft_env"
     
-    if system == "windows":
+    if _SYSTEM == "windows":
         venv_python = os.path.join(venv_name, "Scripts", "python.exe")
         venv_pip = os.path.join(venv_name, "Scripts", "pip.exe")
         activate_script = os.path.join(venv_name, "Scripts", "activate.bat")
@@ -120,18 +134,33 @@ def test_venv_health():
     except subprocess.CalledProcessError:
         return False, "Python executable in venv is corrupted"
     
-    # Test basic imports
-    basic_modules = ["sys", "os", "subprocess"]
-    for module in basic_modules:
-        try:
-            subprocess.run([
-                venv_info["python"], "-c", f"import {module}"
-            ], check=True, capture_output=True)
-        except subprocess.CalledProcessError:
-            return False, f"Basic module {module} import failed"
-    
     return True, "Virtual environment is healthy"
 
+_site_packages_cache = {}
+
+def get_venv_site_packages(venv_info):
+    """Resolve (once) the site-packages directory of the venv"""
+    if venv_info["python"] not in _site_packages_cache:
+        try:
+            result = subprocess.run([
+                venv_info["python"], "-c", "import sysconfig; print(sysconfig.get_paths()['purelib'])"
+            ], check=True, capture_output=True, text=True)
+            _site_packages_cache[venv_info["python"]] = result.stdout.strip() or None
+        except (subprocess.CalledProcessError, OSError):
+            return None
+    
+    return _site_packages_cache[venv_info["python"]]
+
+def _scandir_packages(site_packages):
+    """Read installed package names/versions from *.dist-info directory names"""
+    packages = {}
+    with os.scandir(site_packages) as entries:
+        for entry in entries:
+            if entry.name.endswith(".dist-info"):
+                name, _, version = entry.name[:-len(".dist-info")].partition("-")
+                packages[name.lower().replace("_", "-")] = version
+    return packages
+
 def check_installed_packages():
     """Check what packages are already installed in the venv"""
     venv_info = get_venv_info()
@@ -139,12 +168,20 @@ def check_installed_packages():
     if not venv_info["exists"]:
         return {}
     
+    # Fast path: scan site-packages directly instead of running `pip list`
+    site_packages = get_venv_site_packages(venv_info)
+    if site_packages:
+        try:
+            return _scandir_packages(site_packages)
+        except OSError:
+            pass
+    
+    # Fallback when site-packages can't be resolved or read: ask pip
     try:
         result = subprocess.run([
             venv_info["pip"], "list", "--format=json"
         ], check=True, capture_output=True, text=True)
         
-        import json
         packages = json.loads(result.stdout)
         return {pkg["name"].lower(): pkg["version"] for pkg in packages}
         
@@ -204,6 +241,31 @@ def manage_virtual_environment():
         print("📁 No virtual environment found - will create new one")
         return False, "create"
 
+def _fast_rmtree(path):
+    """Remove a directory tree, preferring the native OS command over shutil"""
+    if _SYSTEM == "windows":
+        command = ["cmd", "/c", "rd", "/s", "/q", path]
+    else:
+        command = ["rm", "-rf", path]
+    
+    try:
+        subprocess.run(command, check=True, capture_output=True)
+        if not os.path.exists(path):
+            return
+    except (subprocess.CalledProcessError, OSError):
+        pass
+    
+    # Fall back to shutil, clearing read-only flags on files it can't delete
+    def make_writable_and_retry(func, failed_path, exc):
+        os.chmod(failed_path, 0o777)
+        func(failed_path)
+    
+    # onerror is deprecated from Python 3.12 in favour of onexc
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=make_writable_and_retry)
+    else:
+        shutil.rmtree(path, onerror=make_writable_and_retry)
+
 def remove_existing_venv():
     """Remove existing virtual environment if needed"""
     venv_info = get_venv_info()
@@ -211,15 +273,7 @@ def remove_existing_venv():
     if venv_info["exists"]:
         print(f"🗑️  Removing existing virtual environment: {venv_info['name']}")
         try:
-            # On Windows, sometimes files are locked, so try multiple approaches
-            if platform.system().lower() == "windows":
-                # Try to deactivate any active venv first
-                try:
-                    subprocess.run(["deactivate"], shell=True, capture_output=True)
-                except:
-                    pass
-            
-            shutil.rmtree(venv_info["name"])
+            _fast_rmtree(venv_info["name"])
             print("✅ Existing virtual environment removed successfully!")
             return True
             
@@ -283,25 +337,62 @@ def upgrade_pip_in_venv():
         print("   Continuing with existing pip version...")
         return True  # Not critical, continue anyway
 
-def install_requirements_in_venv():
-    """Install requirements.txt in the virtual environment"""
-    venv_info = get_venv_info()
-    
-    # Find the appropriate requirements file - prioritize platform-specific ones
-    system = platform.system().lower()
-    if system == "darwin":
+def find_requirements_file():
+    """Find the appropriate requirements file for this platform"""
+    # Prioritize platform-specific requirements files
+    if _SYSTEM == "darwin":
         requirements_files = ["requirements-macos.txt", "requirements.txt"]
-    elif system == "windows":
+    elif _SYSTEM == "windows":
         requirements_files = ["requirements-windows.txt", "requirements.txt"]
     else:
         requirements_files = ["requirements.txt", "requirements-macos.txt", "requirements-windows.txt"]
     
-    requirements_file = None
-    
     for req_file in requirements_files:
         if os.path.exists(req_file):
-            requirements_file = req_file
-            break
+            return req_file
+    
+    return None
+
+def start_wheel_prefetch():
+    """Start downloading all required wheels into the local wheelhouse"""
+    requirements_file = find_requirements_file()
+    if not requirements_file:
+        return None
+    
+    print(f"📥 Prefetching wheels into {WHEELHOUSE_DIR}/ in the background...")
+    
+    # Use the host interpreter's pip: the venv's pip may be mid-upgrade
+    try:
+        return subprocess.Popen([
+            sys.executable, "-m", "pip", "download", "--prefer-binary",
+            "--only-binary", ",".join(BINARY_ONLY_PACKAGES),
+            "--cache-dir", PIP_CACHE_DIR,
+            "-d", WHEELHOUSE_DIR, "-r", requirements_file
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return None
+
+def _run_pip_install(command):
+    """Run a pip install, streaming its output; returns the packages built from source"""
+    # Keep only the tail of the output for error reporting
+    output_tail = deque(maxlen=50)
+    source_builds = []
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          bufsize=1, text=True) as process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+            output_tail.append(line)
+            if line.strip().startswith("Building wheel for"):
+                source_builds.append(line.split()[3])
+    
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command, output="".join(output_tail))
+    return source_builds
+
+def install_requirements_in_venv(use_wheelhouse=False):
+    """Install requirements.txt in the virtual environment"""
+    venv_info = get_venv_info()
+    requirements_file = find_requirements_file()
     
     if not requirements_file:
         print("❌ No requirements file found!")
@@ -310,19 +401,42 @@ def install_requirements_in_venv():
     
     print(f"📦 Installing/updating dependencies from {requirements_file}...")
     
+    command = [
+        venv_info["pip"], "install", "--prefer-binary",
+        "--only-binary", ",".join(BINARY_ONLY_PACKAGES),
+        "--cache-dir", PIP_CACHE_DIR,
+        "-r", requirements_file, "--upgrade"
+    ]
+    if use_wheelhouse:
+        # Everything was prefetched - try fully offline first. Fall back to the index for
+        # build dependencies of sdists, or wheels the venv interpreter won't accept.
+        command += ["--find-links", WHEELHOUSE_DIR]
+        attempts = [command + ["--no-index"], command]
+    else:
+        attempts = [command]
+    
     try:
         # Install requirements using virtual environment pip
-        result = subprocess.run([
-            venv_info["pip"], "install", "-r", requirements_file, "--upgrade"
-        ], check=True, capture_output=True, text=True)
+        for attempt, command in enumerate(attempts, 1):
+            try:
+                source_builds = _run_pip_install(command)
+                break
+            except subprocess.CalledProcessError:
+                if attempt == len(attempts):
+                    raise
+                print("⚠️  Offline install from the wheelhouse failed - retrying with the package index...")
+        
+        # Report packages that had no wheel and were built from source
+        for package in source_builds:
+            print(f"   ⚠️  No binary wheel available, built from source: {package}")
         
         print("✅ Dependencies installed/updated successfully!")
         return True
         
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing dependencies: {e}")
-        if hasattr(e, 'stderr') and e.stderr:
-            print(f"   Error details: {e.stderr}")
+        if e.output:
+            print(f"   Last pip output:\n{e.output}")
         
         print("\n🔧 Troubleshooting suggestions:")
         print(f"   1. Try manually: {venv_info['python']} -m pip install -r {requirements_file}")
@@ -344,15 +458,33 @@ def test_installation():
         ("pyttsx3", "pyttsx3")
     ]
     
+    # Import everything in a single interpreter and report per-module results
+    script = (
+        "import json\n"
+        "res = {}\n"
+        f"for m, n in {test_imports!r}:\n"
+        "    try:\n"
+        "        __import__(m)\n"
+        "        res[n] = 'ok'\n"
+        "    except Exception as e:\n"
+        "        res[n] = str(e)\n"
+        "print(json.dumps(res))\n"
+    )
+    
+    try:
+        result = subprocess.run([
+            venv_info["python"], "-c", script
+        ], check=True, capture_output=True, text=True)
+        import_results = json.loads(result.stdout.strip().splitlines()[-1])
+    except (subprocess.CalledProcessError, json.JSONDecodeError, IndexError):
+        import_results = {}
+    
     failed_imports = []
     
     for module, name in test_imports:
-        try:
-            result = subprocess.run([
-                venv_info["python"], "-c", f"import {module}; print('{name} OK')"
-            ], check=True, capture_output=True, text=True)
+        if import_results.get(name) == "ok":
             print(f"   ✅ {name}")
-        except subprocess.CalledProcessError:
+        else:
             print(f"   ❌ {name}")
             failed_imports.append(name)
     
@@ -367,12 +499,11 @@ def test_installation():
 def create_activation_scripts():
     """Create convenient activation scripts"""
     venv_info = get_venv_info()
-    system = platform.system().lower()
     
     print("📝 Creating/updating activation scripts...")
     
     try:
-        if system == "windows":
+        if _SYSTEM == "windows":
             # Windows batch file
             with open("activate_env.bat", "w") as f:
                 f.write(f"""@echo off
@@ -406,12 +537,11 @@ bash
 def create_run_script():
     """Create a script to run the application with the virtual environment"""
     venv_info = get_venv_info()
-    system = platform.system().lower()
     
     print("🚀 Creating/updating run script...")
     
     try:
-        if system == "windows":
+        if _SYSTEM == "windows":
             # Windows batch file
             with open("run_moodlyft.bat", "w") as f:
                 f.write(f"""@echo off
@@ -513,7 +643,6 @@ read -n 1 -s
 def display_usage_instructions():
     """Display usage instructions"""
     venv_info = get_venv_info()
-    system = platform.system().lower()
     
     print("\n" + "="*60)
     print("🎉 Setup completed successfully!")
@@ -521,7 +650,7 @@ def display_usage_instructions():
     
     print("\n📖 How to use:")
     
-    if system == "windows":
+    if _SYSTEM == "windows":
         print("   Option 1 (Recommended): Double-click run_moodlyft.bat")
         print("   Option 2: Manual activation:")
         print("      1. Double-click activate_env.bat")
@@ -582,12 +711,16 @@ def main():
             if not create_virtual_environment():
                 return 1
         
-        # Step 4: Upgrade pip in virtual environment
-        upgrade_pip_in_venv()
+        # Step 4: Upgrade pip in virtual environment while prefetching wheels
+        pip_upgrade = threading.Thread(target=upgrade_pip_in_venv)
+        pip_upgrade.start()
+        prefetch = start_wheel_prefetch()
+        pip_upgrade.join()
+        wheelhouse_ready = prefetch is not None and prefetch.wait() == 0
         
         # Step 5: Install/update requirements in virtual environment
         if action != "skip":
-            if not install_requirements_in_venv():
+            if not install_requirements_in_venv(use_wheelhouse=wheelhouse_ready):
                 return 1
         
         # Step 6: Test installation
@@ -13,7 +13,8 @@ from .emotion_detector import EmotionAnalyzer, SimpleFER
 from .animation import AnimationManager
 from .ui_elements import ModernUIElements
 from .tts_manager import TTSManager, EmotionFeedbackManager
-from .utils import load_fonts, get_system_info
+from .utils import load_fonts, get_font, get_system_info
+from .config import auto_configure
 
 __all__ = [
     'EmotionAnalyzer',
@@ -23,5 +24,7 @@ __all__ = [
     'TTSManager',
     'EmotionFeedbackManager',
     'load_fonts',
-    'get_system_info'
+    'get_font',
+    'get_system_info',
+    'auto_configure'
 ] 
\ No newline at end of file
@@ -2,21 +2,53 @@ import math
 import time
 from typing import Tuple
 
+import numpy as np
+
 from .config import ANIMATION_DURATIONS, ANIMATION_INTENSITIES
 
 
 class AnimationManager:
     """Handles all animation calculations and effects"""
     
+    # Shared float32 sine table indexed by phase in cycles (1.0 == 2*pi)
+    _SIN_LUT_SIZE = 4096
+    _SIN_LUT = np.sin(np.linspace(0, 2 * np.pi, _SIN_LUT_SIZE, endpoint=False, dtype=np.float32))
+    
     def __init__(self):
         self.animations = {}
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.animation_cache = {}
+        # Frame clock: once tick() is called, all animations in a frame share one timestamp
+        self._now = None
+        self._frame_cache = {}
+    
+    def tick(self, now: float = None) -> None:
+        """Start a new frame: sample the clock once and drop last frame's cached values"""
+        self._now = time.monotonic() if now is None else now
+        self._frame_cache.clear()
+    
+    def _elapsed(self) -> float:
+        """Seconds since start at the current frame time (live time until tick() is used)"""
+        now = self._now
+        return (time.monotonic() if now is None else now) - self.start_time
+    
+    def _sin(self, phase: float) -> float:
+        """Table lookup of sin(2*pi*phase)"""
+        return float(self._SIN_LUT[int(phase * self._SIN_LUT_SIZE) & (self._SIN_LUT_SIZE - 1)])
+    
+    def _sin_field(self, phase: np.ndarray) -> np.ndarray:
+        """Vectorized table lookup of sin(2*pi*phase)"""
+        idx = (phase * self._SIN_LUT_SIZE).astype(np.int64) & (self._SIN_LUT_SIZE - 1)
+        return self._SIN_LUT[idx]
     
     def ease_in_out_cubic(self, t: float) -> float:
         """Smooth easing function for animations"""
         return 3 * t * t - 2 * t * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 3) / 2
     
+    def _ease_in_out_cubic_field(self, t: np.ndarray) -> np.ndarray:
+        """Vectorized ease_in_out_cubic"""
+        return np.where(t < 0.5, 3 * t * t - 2 * t * t * t, 1 - (-2 * t + 2) ** 3 / 2)
+    
     def ease_out_elastic(self, t: float) -> float:
         """Elastic easing for bouncy animations"""
         if t == 0 or t == 1:
@@ -36,11 +68,26 @@ class AnimationManager:
         if intensity is None:
             intensity = ANIMATION_INTENSITIES['pulse']
             
-        elapsed = (time.time() - self.start_time) % duration
-        progress = elapsed / duration
-        base_pulse = 0.5 + 0.5 * math.sin(progress * 2 * math.pi)
-        # Apply easing for smoother pulse
-        eased_pulse = self.ease_in_out_cubic(base_pulse)
+        key = ('pulse', duration, intensity)
+        value = self._frame_cache.get(key)
+        if value is None:
+            elapsed = self._elapsed() % duration
+            progress = elapsed / duration
+            base_pulse = 0.5 + 0.5 * self._sin(progress)
+            # Apply easing for smoother pulse
+            eased_pulse = self.ease_in_out_cubic(base_pulse)
+            value = 0.5 + (eased_pulse - 0.5) * intensity
+            if self._now is not None:
+                self._frame_cache[key] = value
+        return value
+    
+    def vec_pulse(self, periods: np.ndarray, intensity: float = None) -> np.ndarray:
+        """Vectorized create_pulse_animation over an array of periods"""
+        if intensity is None:
+            intensity = ANIMATION_INTENSITIES['pulse']
+        periods = np.asarray(periods, dtype=np.float64)
+        progress = (self._elapsed() % periods) / periods
+        eased_pulse = self._ease_in_out_cubic_field(0.5 + 0.5 * self._sin_field(progress))
         return 0.5 + (eased_pulse - 0.5) * intensity
     
     def create_breath_animation(self, duration: float = None) -> float:
@@ -48,18 +95,31 @@ class AnimationManager:
         if duration is None:
             duration = ANIMATION_DURATIONS['breath']
             
-        elapsed = (time.time() - self.start_time) % duration
-        progress = elapsed / duration
-        # Use cosine for smoother breathing effect
-        intensity = ANIMATION_INTENSITIES['breath']
-        return 0.3 + intensity * (1 + math.cos(progress * 2 * math.pi)) / 2
+        key = ('breath', duration)
+        value = self._frame_cache.get(key)
+        if value is None:
+            elapsed = self._elapsed() % duration
+            progress = elapsed / duration
+            # Use cosine (sine shifted by a quarter cycle) for smoother breathing effect
+            intensity = ANIMATION_INTENSITIES['breath']
+            value = 0.3 + intensity * (1 + self._sin(progress + 0.25)) / 2
+            if self._now is not None:
+                self._frame_cache[key] = value
+        return value
     
     def create_wave_animation(self, x: int, y: int, time_offset: float = 0, speed: float = 1.0) -> float:
         """Creates a wave animation based on position with speed control"""
-        elapsed = (time.time() - self.start_time) * speed + time_offset
-        wave = math.sin(elapsed + x * 0.008 + y * 0.008) * 0.5 + 0.5
+        elapsed = self._elapsed() * speed + time_offset
+        wave = self._sin((elapsed + x * 0.008 + y * 0.008) / (2 * math.pi)) * 0.5 + 0.5
         return self.ease_in_out_cubic(wave)
     
+    def create_wave_field(self, xs: np.ndarray, ys: np.ndarray, time_offset: float = 0, speed: float = 1.0) -> np.ndarray:
+        """Vectorized create_wave_animation evaluated over arrays of positions"""
+        elapsed = self._elapsed() * speed + time_offset
+        phase = (elapsed + (np.asarray(xs) + np.asarray(ys)) * 0.008) / (2 * math.pi)
+        wave = self._sin_field(phase) * 0.5 + 0.5
+        return self._ease_in_out_cubic_field(wave)
+    
     def create_floating_animation(self, base_y: int, amplitude: int = None, duration: float = None) -> int:
         """Creates a floating effect for UI elements"""
         if amplitude is None:
@@ -67,17 +127,19 @@ class AnimationManager:
         if duration is None:
             duration = ANIMATION_DURATIONS['float']
             
-        elapsed = (time.time() - self.start_time) % duration
+        elapsed = self._elapsed() % duration
         progress = elapsed / duration
-        offset = math.sin(progress * 2 * math.pi) * amplitude
+        offset = self._sin(progress) * amplitude
         return base_y + int(offset)
     
     def animate_color_transition(self, from_color: Tuple[int, int, int], 
                                to_color: Tuple[int, int, int], progress: float) -> Tuple[int, int, int]:
         """Smoothly transitions between two colors with easing"""
-        progress = max(0, min(1, progress))
-        eased_progress = self.ease_in_out_cubic(progress)
-        return tuple(int(from_color[i] + (to_color[i] - from_color[i]) * eased_progress) for i in range(3))
+        progress = 0.0 if progress < 0.0 else (1.0 if progress > 1.0 else progress)
+        e = self.ease_in_out_cubic(progress)
+        return (int(from_color[0] + (to_color[0] - from_color[0]) * e),
+                int(from_color[1] + (to_color[1] - from_color[1]) * e),
+                int(from_color[2] + (to_color[2] - from_color[2]) * e))
     
     def animate_scale(self, base_scale: float, progress: float, max_scale: float = 1.2) -> float:
         """Animate scale with bounce effect"""
@@ -91,7 +153,7 @@ class AnimationManager:
     
     def create_ripple_effect(self, center_x: int, center_y: int, radius: float, max_radius: float = 100) -> float:
         """Creates expanding ripple animation"""
-        elapsed = (time.time() - self.start_time) % 3.0  # 3 second cycle
+        elapsed = self._elapsed() % 3.0  # 3 second cycle
         progress = elapsed / 3.0
         
         # Calculate distance-based intensity
@@ -105,26 +167,27 @@ class AnimationManager:
         
         # Smooth falloff
         intensity = math.sin(wave_progress * math.pi) * (1 - wave_progress)
-        return max(0, intensity)
+        return intensity if intensity > 0.0 else 0.0
     
     def create_glow_animation(self, base_intensity: float = 0.5, speed: float = 1.0) -> float:
         """Creates a soft glowing effect"""
-        elapsed = (time.time() - self.start_time) * speed
-        glow = base_intensity + ANIMATION_INTENSITIES['glow'] * math.sin(elapsed) * 0.5
-        return max(0, min(1, glow))
+        elapsed = self._elapsed() * speed
+        glow = base_intensity + ANIMATION_INTENSITIES['glow'] * self._sin(elapsed / (2 * math.pi)) * 0.5
+        return 0.0 if glow < 0.0 else (1.0 if glow > 1.0 else glow)
     
     def create_sparkle_animation(self, x: int, y: int, frequency: float = 0.1) -> bool:
         """Creates random sparkle effects based on position and time"""
         # Use position and time to create pseudo-random sparkles
         seed = (x * 7 + y * 13) % 100
-        time_factor = int((time.time() - self.start_time) * 10) % 100
+        time_factor = int(self._elapsed() * 10) % 100
         combined = (seed + time_factor) % 100
         return combined < (frequency * 100)
     
     def reset_time(self):
         """Reset animation start time"""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._frame_cache.clear()
     
     def get_elapsed_time(self) -> float:
         """Get elapsed time since animation start"""
-        return time.time() - self.start_time 
\ No newline at end of file
+        return time.monotonic() - self.start_time 
\ No newline at end of file
@@ -3,7 +3,10 @@ Configuration file for MoodLyft-Mirror
 Adjust these settings based on your hardware capabilities and preferences
 """
 
+import functools
 import os
+import threading
+import time
 from typing import Dict, List, Tuple
 
 ########################################
@@ -12,9 +15,16 @@ from typing import Dict, List, Tuple
 VIDEOS_DIR = "Output/Videos"
 SCREENSHOTS_DIR = "Output/Screenshots"
 
-# Ensure directories exist
-os.makedirs(VIDEOS_DIR, exist_ok=True)
-os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+_output_dirs_ready = False
+
+def ensure_output_dirs():
+    """Create the output directories on first use instead of at import time"""
+    global _output_dirs_ready
+    if _output_dirs_ready:
+        return
+    os.makedirs(VIDEOS_DIR, exist_ok=True)
+    os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+    _output_dirs_ready = True
 
 ########################################
 # PERFORMANCE SETTINGS
@@ -25,6 +35,15 @@ DEFAULT_CAMERA_WIDTH = 640
 DEFAULT_CAMERA_HEIGHT = 480
 DEFAULT_FPS = 30
 
+# Face detection models. Optional files are looked up in models/:
+#   face_detection_yunet_2023mar.onnx  (OpenCV model zoo, "dnn" detector)
+#   lbpcascade_frontalface_improved.xml (OpenCV repo, "lbp" detector)
+# Missing detectors fall back dnn -> lbp -> haar (bundled with OpenCV).
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+FACE_DETECTION_MODEL = os.path.join(MODELS_DIR, "face_detection_yunet_2023mar.onnx")
+FACE_DETECTION_LBP_CASCADE = "lbpcascade_frontalface_improved.xml"
+FACE_DETECTION_THRESHOLD = 0.5
+
 # Cooldown timings (in seconds)
 COMPLIMENT_COOLDOWN = 1
 NO_FACE_COOLDOWN = 5
@@ -33,55 +52,55 @@ NO_FACE_COOLDOWN = 5
 # ENHANCED EMOTION DATA
 ########################################
 COMPLIMENTS = {
-    "happy": [
+    "happy": (
         "Your radiant smile lights up the entire room!",
         "That genuine happiness is absolutely contagious!",
         "You have such a warm, inviting presence!",
         "Your joy creates beautiful ripples of positivity!",
         "Keep shining with that magnificent energy!"
-    ],
-    "neutral": [
+    ),
+    "neutral": (
         "Your calm presence brings such peaceful energy!",
         "There's incredible strength in your composure!",
         "Your steady energy is truly admirable!",
         "You bring perfect balance wherever you go!",
         "Your mindful presence is deeply appreciated!"
-    ],
-    "sad": [
+    ),
+    "sad": (
         "You're so much stronger than you realize!",
         "Every storm passes - brighter days ahead!",
         "Your resilience is truly inspiring to witness!",
         "Better days are coming - believe in yourself!",
         "You're never alone in this beautiful journey!"
-    ],
-    "angry": [
+    ),
+    "angry": (
         "Channel that powerful energy into positive change!",
         "Your passion can truly move mountains!",
         "Transform that fire into unstoppable motivation!",
         "Your intensity can spark absolutely amazing things!",
         "Use that incredible power to achieve greatness!"
-    ],
-    "surprise": [
+    ),
+    "surprise": (
         "Your sense of wonder is so refreshing!",
         "Stay curious and keep exploring life!",
         "Life is overflowing with amazing discoveries!",
         "Your enthusiasm is beautifully infectious!",
         "Keep embracing new and exciting experiences!"
-    ],
-    "fear": [
+    ),
+    "fear": (
         "Courage isn't fearlessness - it's facing fear head-on!",
         "You're so much braver than you believe!",
         "Every step forward conquers fear completely!",
         "Your strength shines through any uncertainty!",
         "Fear is temporary - your courage is permanent!"
-    ],
-    "disgust": [
+    ),
+    "disgust": (
         "Your standards show incredible self-respect!",
         "Trust your instincts - they serve you perfectly!",
         "Your boundaries protect your inner peace!",
         "Standing firm shows true inner strength!",
         "Your authenticity is genuinely powerful!"
-    ]
+    )
 }
 
 ########################################
@@ -99,15 +118,22 @@ COLOR_MAP = {
 
 # Enhanced emoji set with variations
 EMOJIS = {
-    "happy": ["😊", "😁", "😄", "🥰", "😍"],
-    "neutral": ["😌", "😐", "🙂", "😶", "😏"],
-    "sad": ["🥺", "😢", "😔", "😞", "🙁"],
-    "angry": ["😤", "😠", "😡", "🤬", "😾"],
-    "surprise": ["😲", "😮", "🤯", "😱", "🙀"],
-    "fear": ["😨", "😰", "😱", "🫣", "😧"],
-    "disgust": ["😖", "🤢", "😬", "🙄", "😒"]
+    "happy": ("😊", "😁", "😄", "🥰", "😍"),
+    "neutral": ("😌", "😐", "🙂", "😶", "😏"),
+    "sad": ("🥺", "😢", "😔", "😞", "🙁"),
+    "angry": ("😤", "😠", "😡", "🤬", "😾"),
+    "surprise": ("😲", "😮", "🤯", "😱", "🙀"),
+    "fear": ("😨", "😰", "😱", "🫣", "😧"),
+    "disgust": ("😖", "🤢", "😬", "🙄", "😒")
 }
 
+# Integer-indexed views of the emotion tables for hot paths
+EMOTION_ORDER = ("happy", "neutral", "sad", "angry", "surprise", "fear", "disgust")
+EMOTION_IDS = {name: i for i, name in enumerate(EMOTION_ORDER)}
+
+# Color schemes indexed by emotion id
+COLOR_MAP_T = tuple(COLOR_MAP[name] for name in EMOTION_ORDER)
+
 ########################################
 # FONT CONFIGURATIONS
 ########################################
@@ -135,6 +161,7 @@ FONT_PATHS = {
 TTS_RATE = 140  # Speech rate (slower for better clarity)
 TTS_VOLUME = 0.9  # Speech volume
 TTS_PREFERRED_VOICES = ['en_US', 'female', 'english']
+TTS_BATCH_UTTERANCES = False  # Speak queued phrases together instead of only the newest one
 
 ########################################
 # UI SETTINGS
@@ -145,6 +172,9 @@ UI_ROUNDED_CORNER_RADIUS = 20
 UI_CONFIDENCE_BAR_HEIGHT = 8
 UI_BORDER_THICKNESS = 3
 
+# Animated border styles (indices into ModernUIElements' border renderers)
+BORDER_GLOW, BORDER_WAVE, BORDER_PULSE = 0, 1, 2
+
 # Animation settings
 ANIMATION_DURATIONS = {
     'pulse': 2.0,
@@ -173,6 +203,10 @@ class PerformanceConfig:
     CAMERA_HEIGHT = DEFAULT_CAMERA_HEIGHT
     CAMERA_FPS = DEFAULT_FPS
     
+    # Face detection: "dnn" (YuNet), "lbp" (fast cascade) or "haar"
+    FACE_DETECTOR = "dnn"
+    FACE_MIN_SIZE = 30  # Smallest face (pixels, at 320x240) to detect
+    
     # Frame processing
     ENABLE_THREADING = True  # Enable threaded TTS
     BUFFER_SIZE = 1  # Camera buffer size (lower = less latency)
@@ -212,6 +246,7 @@ class AudioConfig:
     # Text-to-speech
     TTS_RATE = TTS_RATE
     TTS_VOLUME = TTS_VOLUME
+    TTS_BATCH_UTTERANCES = TTS_BATCH_UTTERANCES
     
     # Timing
     COMPLIMENT_COOLDOWN = COMPLIMENT_COOLDOWN
@@ -259,6 +294,7 @@ class HardwarePresets:
         """Settings for high-end hardware"""
         PerformanceConfig.EMOTION_SKIP_FRAMES = 1
         PerformanceConfig.CAMERA_FPS = 30
+        PerformanceConfig.FACE_DETECTOR = "dnn"
         VisualConfig.ENABLE_ANIMATIONS = True
         VisualConfig.ENABLE_GLASSMORPHISM = True
         VisualConfig.ENABLE_GLOW_EFFECTS = True
@@ -269,6 +305,7 @@ class HardwarePresets:
         """Balanced settings for most hardware"""
         PerformanceConfig.EMOTION_SKIP_FRAMES = 3
         PerformanceConfig.CAMERA_FPS = 30
+        PerformanceConfig.FACE_DETECTOR = "lbp"
         VisualConfig.ENABLE_ANIMATIONS = True
         VisualConfig.ENABLE_GLASSMORPHISM = True
         VisualConfig.ENABLE_GLOW_EFFECTS = True
@@ -279,6 +316,7 @@ class HardwarePresets:
         """Settings optimized for older hardware"""
         PerformanceConfig.EMOTION_SKIP_FRAMES = 5
         PerformanceConfig.CAMERA_FPS = 20
+        PerformanceConfig.FACE_DETECTOR = "lbp"
         PerformanceConfig.CAMERA_WIDTH = 640
         PerformanceConfig.CAMERA_HEIGHT = 480
         VisualConfig.ENABLE_ANIMATIONS = False
@@ -291,36 +329,80 @@ class HardwarePresets:
         """Settings for laptops/mobile devices"""
         PerformanceConfig.EMOTION_SKIP_FRAMES = 7
         PerformanceConfig.CAMERA_FPS = 15
+        PerformanceConfig.FACE_DETECTOR = "lbp"
+        PerformanceConfig.FACE_MIN_SIZE = 40
         VisualConfig.ENABLE_ANIMATIONS = False
         VisualConfig.ANIMATION_SPEED = 0.5
         AudioConfig.COMPLIMENT_COOLDOWN = 15
 
-# Auto-detect and apply appropriate preset
-def auto_configure():
-    """Automatically configure based on system capabilities"""
+# Preset chosen by auto_configure, remembered across launches
+PRESET_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "moodlyft", "preset")
+PRESET_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+
+PRESET_MESSAGES = {
+    "high_performance": "🚀 High-performance system detected - applying high-performance preset",
+    "balanced": "⚖️ Balanced system detected - applying balanced preset",
+    "performance_mode": "🔋 Lower-end system detected - applying performance preset",
+}
+
+def _detect_preset() -> str:
+    """Pick the hardware preset name from system capabilities"""
     import psutil
-    import platform
     
     # Get system info
     cpu_count = psutil.cpu_count()
     memory_gb = psutil.virtual_memory().total / (1024**3)
-    system = platform.system()
     
-    # Apply preset based on system capabilities
+    # Choose preset based on system capabilities
     if cpu_count >= 8 and memory_gb >= 16:
-        print("🚀 High-performance system detected - applying high-performance preset")
-        HardwarePresets.high_performance()
+        return "high_performance"
     elif cpu_count >= 4 and memory_gb >= 8:
-        print("⚖️ Balanced system detected - applying balanced preset")
-        HardwarePresets.balanced()
-    else:
-        print("🔋 Lower-end system detected - applying performance preset")
-        HardwarePresets.performance_mode()
+        return "balanced"
+    return "performance_mode"
 
-# Apply auto-configuration by default
-if __name__ != "__main__":
+def _save_preset(preset: str) -> None:
+    """Remember the detected preset for the next launch"""
     try:
-        auto_configure()
+        os.makedirs(os.path.dirname(PRESET_CACHE_FILE), exist_ok=True)
+        with open(PRESET_CACHE_FILE, "w") as f:
+            f.write(preset)
+    except OSError:
+        pass
+
+def _refresh_preset_cache() -> None:
+    """Re-detect the preset and update the cache (used from a background thread)"""
+    try:
+        _save_preset(_detect_preset())
+    except ImportError:
+        pass
+
+# Auto-detect and apply appropriate preset
+@functools.lru_cache(maxsize=1)
+def auto_configure():
+    """Automatically configure based on system capabilities (runs once)"""
+    # Reuse the preset from a previous launch; refresh it in the background when stale
+    try:
+        with open(PRESET_CACHE_FILE) as f:
+            cached = f.read().strip()
+        age = time.time() - os.path.getmtime(PRESET_CACHE_FILE)
+    except OSError:
+        cached, age = None, None
+    
+    if cached in PRESET_MESSAGES:
+        print(f"{PRESET_MESSAGES[cached]} (cached)")
+        getattr(HardwarePresets, cached)()
+        if age > PRESET_CACHE_MAX_AGE:
+            threading.Thread(target=_refresh_preset_cache, daemon=True).start()
+        return
+    
+    try:
+        preset = _detect_preset()
     except ImportError:
         print("⚖️ Unable to detect system specs - using balanced preset")
-        HardwarePresets.balanced() 
\ No newline at end of file
+        HardwarePresets.balanced()
+        return
+    
+    # Apply preset based on system capabilities
+    print(PRESET_MESSAGES[preset])
+    getattr(HardwarePresets, preset)()
+    _save_preset(preset)
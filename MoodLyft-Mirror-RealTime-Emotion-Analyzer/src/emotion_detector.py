@@ -1,95 +1,308 @@
 import cv2
+import logging
 import numpy as np
-import random
+import os
+import queue
+import threading
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from .config import (
+    FACE_DETECTION_MODEL, FACE_DETECTION_LBP_CASCADE, FACE_DETECTION_THRESHOLD,
+    MODELS_DIR, PerformanceConfig, EMOTION_ORDER
+)
+
+# Shared PCG64 generator for all detector randomness
+_RNG = np.random.default_rng()
+
+# Optional: numba compiles the per-face post-processing loop
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _update_face_states(faces, scales, now, stab_emotion, stab_conf, stab_next, cdf,
+                            u_emotion, u_conf, u_next):
+        """Scale boxes and update/read per-grid-cell emotion state for every face"""
+        n = faces.shape[0]
+        boxes = np.empty((n, 4), np.int32)
+        emotion_ids = np.empty(n, np.int8)
+        confidences = np.empty(n, np.float32)
+        for i in range(n):
+            for j in range(4):
+                boxes[i, j] = np.int32(faces[i, j] * scales[j])
+            idx = ((boxes[i, 0] >> 6) & 15) * 16 + ((boxes[i, 1] >> 6) & 15)
+            # Change emotion every 3-5 seconds for demo
+            if now >= stab_next[idx]:
+                stab_emotion[idx] = np.searchsorted(cdf, u_emotion[i], side='right')
+                stab_conf[idx] = 0.6 + 0.35 * u_conf[i]
+                stab_next[idx] = now + 3.0 + 2.0 * u_next[i]
+            emotion_ids[i] = stab_emotion[idx]
+            confidences[i] = stab_conf[idx]
+        return boxes, emotion_ids, confidences
+else:
+    _update_face_states = None
 
 class SimpleFER:
     """Simple emotion detector for demonstration without FER dependency"""
     
-    def __init__(self, mtcnn=False):
+    def __init__(self, mtcnn=False, detector: Optional[str] = None):
         # Ignore mtcnn parameter for compatibility
-        self.emotions = ["happy", "sad", "angry", "surprise", "fear", "disgust", "neutral"]
-        self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        self.last_emotion_time = {}
-        self.emotion_stability = {}
+        # Same order as config.EMOTION_ORDER so drawn indices are EMOTION_IDS
+        self.emotions = EMOTION_ORDER
+        # Weighted random selection (more happy/neutral for demo)
+        self._weights = np.asarray([0.3, 0.25, 0.1, 0.1, 0.15, 0.05, 0.05])
+        # Cumulative weights, so draws are a single searchsorted over uniforms
+        self._cdf = np.cumsum(self._weights)
+        self._cdf[-1] = 1.0
+        self._rng = _RNG
+        
+        # Face detector: "dnn", "lbp" or "haar", falling back in that order
+        detector = detector or PerformanceConfig.FACE_DETECTOR
+        self.min_face_size = PerformanceConfig.FACE_MIN_SIZE
+        self.face_net = self._load_face_net() if detector == "dnn" else None
+        self.face_cascade = None
+        if self.face_net is None:
+            self.face_cascade = self._load_cascade(prefer_lbp=detector != "haar")
+        # Per face-grid-cell emotion state (16x16 cells of 64px), as parallel arrays
+        self._stab_emotion = np.full(256, -1, np.int8)
+        self._stab_conf = np.zeros(256, np.float32)
+        self._stab_next = np.zeros(256, np.float64)
+        # Run the cascade pipeline through OpenCV's OpenCL (T-API) backend when it is available
+        # and enabled. The process-wide switch is left as is, so this agrees with ModernUIElements.
+        self._use_opencl = self.face_cascade is not None and cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        if self._use_opencl:
+            logging.info("Using OpenCL for face detection")
+        # Reused detection buffers and frame-to-detection scale factors
+        self._small = np.empty((240, 320, 3), np.uint8)
+        self._gray = np.empty((240, 320), np.uint8)
+        self._frame_shape = None
+        self._scales = np.ones(4, dtype=np.float32)
+        self._unit_scales = np.ones(4, dtype=np.float32)
+        # Last analyzed frame and its results, so repeated calls reuse them
+        self._last_frame = None
+        self._last_results = []
+    
+    @staticmethod
+    def _load_face_net() -> Optional["cv2.FaceDetectorYN"]:
+        """Load the YuNet CNN face detector if its ONNX model is available"""
+        if not hasattr(cv2, "FaceDetectorYN"):
+            logging.info("YuNet DNN face detector skipped: this OpenCV build has no FaceDetectorYN")
+            return None
+        if not os.path.exists(FACE_DETECTION_MODEL):
+            logging.info(f"YuNet DNN face detector skipped: model not found at {FACE_DETECTION_MODEL}")
+            return None
+        try:
+            net = cv2.FaceDetectorYN.create(FACE_DETECTION_MODEL, "", (320, 240), FACE_DETECTION_THRESHOLD)
+            logging.info("Using YuNet DNN face detector")
+            return net
+        except cv2.error as e:
+            logging.warning(f"Failed to load YuNet face detector, falling back to cascade: {e}")
+            return None
+    
+    @staticmethod
+    def _load_cascade(prefer_lbp: bool) -> "cv2.CascadeClassifier":
+        """Load the LBP face cascade if available, otherwise the Haar cascade"""
+        if prefer_lbp:
+            for cascade_dir in (cv2.data.haarcascades, MODELS_DIR):
+                cascade_path = os.path.join(cascade_dir, FACE_DETECTION_LBP_CASCADE)
+                if os.path.exists(cascade_path):
+                    cascade = cv2.CascadeClassifier(cascade_path)
+                    if not cascade.empty():
+                        logging.info("Using LBP face cascade")
+                        return cascade
+            logging.info(f"LBP face cascade skipped: {FACE_DETECTION_LBP_CASCADE} not found in OpenCV data or {MODELS_DIR}")
+        logging.info("Using Haar face cascade")
+        return cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+    
+    def _detect_faces(self, small_frame: np.ndarray) -> np.ndarray:
+        """Return face boxes (x, y, w, h) in small_frame coordinates"""
+        if self.face_net is not None:
+            # Single forward pass of the CNN on the color frame
+            _, faces = self.face_net.detect(small_frame)
+            if faces is None:
+                return np.empty((0, 4), dtype=np.int32)
+            return faces[:, :4].astype(np.int32)
+        
+        if self._use_opencl:
+            gray = cv2.cvtColor(small_frame, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = cv2.cvtColor(small_frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return self.face_cascade.detectMultiScale(gray, 1.3, 5, minSize=(self.min_face_size, self.min_face_size))
         
     def detect_emotions(self, frame: np.ndarray) -> List[Dict]:
         """Detect faces and assign random emotions for demo - optimized for speed"""
-        # Resize frame for faster processing
-        small_frame = cv2.resize(frame, (320, 240))
-        gray = cv2.cvtColor(small_frame, cv2.COLOR_BGR2GRAY)
-        faces = self.face_cascade.detectMultiScale(gray, 1.3, 5, minSize=(30, 30))
-        
-        # Scale back to original frame size
-        scale_x = frame.shape[1] / 320
-        scale_y = frame.shape[0] / 240
+        if frame is self._last_frame:
+            return self._last_results
         
-        results = []
-        for (x, y, w, h) in faces:
-            # Scale back coordinates
-            x = int(x * scale_x)
-            y = int(y * scale_y)
-            w = int(w * scale_x)
-            h = int(h * scale_y)
-            
-            # Create stable emotion for each face position
-            face_id = f"{x//50}_{y//50}"  # Rough face position ID
+        # Resize frame for faster processing (skipped when the camera already matches)
+        h, w = frame.shape[:2]
+        src = cv2.UMat(frame) if self._use_opencl else frame
+        if (h, w) == (240, 320):
+            faces = self._detect_faces(src)
+            scales = None
+        else:
+            if self._use_opencl:
+                small_frame = cv2.resize(src, (320, 240))
+            else:
+                small_frame = cv2.resize(frame, (320, 240), dst=self._small)
+            faces = self._detect_faces(small_frame)
             
-            current_time = time.time()
+            # Scale back to original frame size
+            if (h, w) != self._frame_shape:
+                self._frame_shape = (h, w)
+                self._scales = np.array([w / 320, h / 240, w / 320, h / 240], dtype=np.float32)
+            scales = self._scales
+        
+        faces = np.asarray(faces, dtype=np.float32).reshape(-1, 4)
+        now = time.monotonic()
+        
+        if _update_face_states is not None:
+            # Compiled per-face loop: scaling, grid cell, stability check and update
+            n = len(faces)
+            boxes, emotion_ids, confidences = _update_face_states(
+                faces, self._unit_scales if scales is None else scales, now,
+                self._stab_emotion, self._stab_conf, self._stab_next, self._cdf,
+                self._rng.random(n), self._rng.random(n), self._rng.random(n)
+            )
+            boxes = boxes.tolist()
+        else:
+            # Scale back coordinates of all faces in one multiply
+            boxes = (faces if scales is None else faces * scales).astype(np.int32).tolist()
             
-            # Change emotion every 3-5 seconds for demo
-            if (face_id not in self.last_emotion_time or 
-                current_time - self.last_emotion_time[face_id] > random.uniform(3, 5)):
-                
-                # Weighted random selection (more happy/neutral for demo)
-                weights = [0.3, 0.1, 0.1, 0.15, 0.05, 0.05, 0.25]  # favor happy and neutral
-                emotion = np.random.choice(self.emotions, p=weights)
-                confidence = random.uniform(0.6, 0.95)
-                
-                self.emotion_stability[face_id] = (emotion, confidence)
-                self.last_emotion_time[face_id] = current_time
-            else:
-                emotion, confidence = self.emotion_stability.get(face_id, ("neutral", 0.8))
+            # Create stable emotion for each face position (rough face position ID)
+            cells = np.array([((x >> 6) & 15) * 16 + ((y >> 6) & 15) for (x, y, _, _) in boxes], dtype=np.intp)
             
-            result = {
-                'box': [x, y, w, h],
-                'emotions': {emotion: confidence}
-            }
-            results.append(result)
+            # Change emotion every 3-5 seconds for demo, drawing all new ones in one batch
+            need_new = cells[now >= self._stab_next[cells]]
+            k = len(need_new)
+            if k:
+                self._stab_emotion[need_new] = np.searchsorted(self._cdf, self._rng.random(k), side='right')
+                self._stab_conf[need_new] = self._rng.uniform(0.6, 0.95, size=k)
+                self._stab_next[need_new] = now + self._rng.uniform(3, 5, size=k)
             
+            emotion_ids = self._stab_emotion[cells]
+            confidences = self._stab_conf[cells]
+        
+        results = [
+            {'box': [x, y, w, h], 'emotions': {self.emotions[emotion_id]: confidence},
+             'top': (self.emotions[emotion_id], confidence), 'emotion_id': emotion_id}
+            for (x, y, w, h), emotion_id, confidence
+            in zip(boxes, emotion_ids.tolist(), confidences.tolist())
+        ]
+        
+        self._last_frame = frame
+        self._last_results = results
         return results
     
     def top_emotion(self, frame: np.ndarray) -> Dict:
         """Get the top emotion for compatibility with FER API"""
-        results = self.detect_emotions(frame)
+        return self.top_emotion_from_results(self.detect_emotions(frame))
+    
+    @staticmethod
+    def top_emotion_from_results(results: List[Dict]) -> Dict:
+        """Get the top emotion from already computed detect_emotions results"""
         if results:
             # Get the first face's emotion
-            first_face = results[0]
-            emotions = first_face['emotions']
-            top_emotion = max(emotions.items(), key=lambda x: x[1])
-            return {top_emotion[0]: top_emotion[1]}
+            return dict([results[0]['top']])
         return {}
 
 
+class _DetectorThread(threading.Thread):
+    """Runs face/emotion detection off the capture loop on the newest frame"""
+    
+    def __init__(self, detector: SimpleFER):
+        super().__init__(daemon=True)
+        self.detector = detector
+        self.in_q = queue.Queue(maxsize=1)
+        self.lock = threading.Lock()
+        self.latest = None  # None until the first detection finishes
+        self.is_running = True
+    
+    def submit(self, frame: np.ndarray) -> None:
+        """Hand a frame to the worker, replacing any frame still waiting"""
+        try:
+            self.in_q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self.in_q.put_nowait(frame)
+        except queue.Full:
+            pass
+    
+    def get_latest(self) -> Optional[Tuple[List[Dict], Dict]]:
+        """Most recent (faces_data, dominant_emotion) result, or None if there is none yet"""
+        with self.lock:
+            return self.latest
+    
+    def run(self):
+        while self.is_running:
+            try:
+                frame = self.in_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            
+            try:
+                faces_data = self.detector.detect_emotions(frame)
+                top_emotion = self.detector.top_emotion_from_results(faces_data)
+            except Exception as e:
+                logging.error(f"Emotion detection error: {e}")
+                continue
+            
+            with self.lock:
+                self.latest = (faces_data, top_emotion)
+    
+    def stop(self):
+        """Stop the worker thread"""
+        self.is_running = False
+        if self.is_alive():
+            self.join(timeout=1.0)
+
+
 class EmotionAnalyzer:
     """Wrapper class for emotion detection with additional functionality"""
     
-    def __init__(self, use_mtcnn: bool = True):
+    def __init__(self, use_mtcnn: bool = True, threaded: bool = True):
         self.detector = SimpleFER(mtcnn=use_mtcnn)
         
-    def analyze_frame(self, frame: np.ndarray) -> Tuple[List[Dict], Dict]:
+        # Detect in the background so capture/render never waits on it
+        self._worker = None
+        if threaded:
+            self._worker = _DetectorThread(self.detector)
+            self._worker.start()
+        
+    @property
+    def threaded(self) -> bool:
+        """Whether detection runs on the background worker (analyze_frame never blocks)"""
+        return self._worker is not None
+    
+    def analyze_frame(self, frame: np.ndarray) -> Optional[Tuple[List[Dict], Dict]]:
         """
         Analyze frame for emotions and return results
         
+        In threaded mode the frame is queued for the background detector and
+        the latest available results (possibly from an earlier frame) are
+        returned immediately, or None while the first detection is still running.
+        
         Returns:
-            Tuple of (faces_data, dominant_emotion)
+            Tuple of (faces_data, dominant_emotion), or None if no result yet
         """
+        if self._worker is not None:
+            self._worker.submit(frame)
+            return self._worker.get_latest()
+        
         faces_data = self.detector.detect_emotions(frame)
-        top_emotion = self.detector.top_emotion(frame)
+        top_emotion = self.detector.top_emotion_from_results(faces_data)
         
         return faces_data, top_emotion
     
+    def stop(self):
+        """Stop background detection"""
+        if self._worker is not None:
+            self._worker.stop()
+    
     def get_emotion_confidence(self, emotions_dict: Dict) -> float:
         """Get confidence score from emotions dictionary"""
         if not emotions_dict:
@@ -100,6 +313,8 @@ class EmotionAnalyzer:
         """Get the emotion with highest confidence"""
         if not emotions_dict:
             return "neutral"
+        if len(emotions_dict) == 1:
+            return next(iter(emotions_dict))
         return max(emotions_dict.items(), key=lambda x: x[1])[0]
     
     def is_high_confidence(self, emotions_dict: Dict, threshold: float = 0.7) -> bool:
@@ -4,51 +4,111 @@ TTS Manager Module
 Handles text-to-speech functionality with thread safety and error handling
 """
 
+import math
 import time
 import logging
+import platform
 import random
+import re
+import subprocess
 import pyttsx3
 import threading
-import queue
+from collections import deque
+from types import MappingProxyType
 from typing import Optional, List, Dict
 
 from .config import (
-    COMPLIMENTS, TTS_RATE, TTS_VOLUME, TTS_PREFERRED_VOICES,
+    COMPLIMENTS, TTS_RATE, TTS_VOLUME, TTS_PREFERRED_VOICES, TTS_BATCH_UTTERANCES,
     COMPLIMENT_COOLDOWN, NO_FACE_COOLDOWN
 )
 
+log = logging.getLogger(__name__)
+
+_SYSTEM = platform.system()
+_IS_DARWIN = _SYSTEM == "Darwin"
+# Any preferred voice fragment, matched case-insensitively in one search (None if none configured)
+_PREFERRED_VOICE_RE = (
+    re.compile("|".join(map(re.escape, TTS_PREFERRED_VOICES)), re.IGNORECASE)
+    if TTS_PREFERRED_VOICES else None
+)
+# Absolute path plus close_fds=False lets Popen launch 'say' via posix_spawn
+_SAY_CMD_PREFIX = ["/usr/bin/say", "-r", str(TTS_RATE)]
+
 ########################################
 # TTS MANAGER
 ########################################
 class TTSManager:
     """Thread-safe TTS manager with robust error handling"""
     
+    __slots__ = (
+        "engine", "_engine_lock", "available", "current_voice", "speech_queue", "_queue_cv", "_gen", "_speaking_gen",
+        "_speaking_topic", "_cancel_gen", "worker_thread", "_say_proc", "_say_proc_gen", "_speaking", "is_running",
+        "_voices_cache", "_voice_info_cache", "_init_done", "_preempt_token"
+    )
+    
     def __init__(self):
         self.engine = None
+        # pyttsx3 drivers are not thread-safe; every use of self.engine (including the
+        # worker's say/runAndWait) holds this lock
+        self._engine_lock = threading.Lock()
+        # Handle for the worker's 'started-word' callback on self.engine
+        self._preempt_token = None
         self.available = False
         self.current_voice = None
-        self.speech_queue = queue.Queue(maxsize=5)
+        # Installed voices, enumerated once from the driver
+        self._voices_cache = None
+        self._voice_info_cache = None
+        # Pending (text, done_event, topic) entries; appending to a full queue evicts the oldest one
+        self.speech_queue = deque(maxlen=4)
+        self._queue_cv = threading.Condition(threading.Lock())
+        # Bumped per request. The batch being spoken has _speaking_gen and _speaking_topic;
+        # setting _cancel_gen to _speaking_gen cuts it off. All of these change under _queue_cv.
+        self._gen = 0
+        self._speaking_gen = 0
+        self._speaking_topic = None
+        self._cancel_gen = -1
         self.worker_thread = None
+        # Running 'say' process and the generation of the batch it speaks (set under _queue_cv)
+        self._say_proc = None
+        self._say_proc_gen = -1
+        self._speaking = threading.Event()
         self.is_running = True
         
-        logging.info("Initializing TTS engine...")
-        
-        if self._initialize_engine():
-            self._start_worker()
-            logging.info("✅ TTS engine initialized successfully")
-        else:
-            logging.warning("⚠️ TTS engine initialization failed - continuing without TTS")
+        # Bring the engine up in the background so the camera loop can start right away
+        self._init_done = threading.Event()
+        threading.Thread(target=self._background_init, daemon=True).start()
+    
+    def _background_init(self):
+        """Initialize the engine and start the worker off the constructor thread"""
+        try:
+            log.info("Initializing TTS engine...")
+            
+            if self._initialize_engine():
+                if self.is_running:
+                    self._start_worker()
+                log.info("✅ TTS engine initialized successfully")
+            else:
+                log.warning("⚠️ TTS engine initialization failed - continuing without TTS")
+        finally:
+            self._init_done.set()
+    
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until background initialization has finished; returns whether TTS is available"""
+        self._init_done.wait(timeout)
+        return self.available
     
     def _initialize_engine(self) -> bool:
         """Initialize the TTS engine"""
         try:
-            self.engine = pyttsx3.init()
-            if self.engine:
-                self._configure_engine()
-                self.available = True
-                return True
+            with self._engine_lock:
+                self.invalidate_voice_cache()
+                self.engine = pyttsx3.init()
+                if self.engine:
+                    self._configure_engine()
+                    self.available = True
+                    return True
         except Exception as e:
-            logging.error(f"TTS initialization failed: {e}")
+            log.error(f"TTS initialization failed: {e}")
         
         self.available = False
         return False
@@ -58,38 +118,38 @@ class TTSManager:
         try:
             self.engine.setProperty('rate', TTS_RATE)
             self.engine.setProperty('volume', TTS_VOLUME)
-            logging.info("TTS engine configured successfully")
+            log.info("TTS engine configured successfully")
             
             # Set preferred voice
             self._set_preferred_voice()
             
         except Exception as e:
-            logging.warning(f"TTS configuration warning: {e}")
+            log.warning(f"TTS configuration warning: {e}")
     
     def _set_preferred_voice(self):
         """Set preferred voice if available"""
         try:
-            voices = self.engine.getProperty('voices')
+            voices = self._get_voices()
             if not voices:
                 return
             
-            # Try to find preferred voice
-            for voice in voices:
-                for preference in TTS_PREFERRED_VOICES:
-                    if preference.lower() in voice.name.lower():
+            # Try to find preferred voice, scanning id and name in one search
+            if _PREFERRED_VOICE_RE is not None:
+                for voice in voices:
+                    if _PREFERRED_VOICE_RE.search(f"{voice.id or ''}\x00{voice.name or ''}"):
                         self.engine.setProperty('voice', voice.id)
                         self.current_voice = voice.name
-                        logging.info(f"Set TTS voice to: {voice.name}")
+                        log.info(f"Set TTS voice to: {voice.name}")
                         return
             
             # Fallback to first available voice
             if voices:
                 self.engine.setProperty('voice', voices[0].id)
                 self.current_voice = voices[0].name
-                logging.info(f"Using default voice: {voices[0].name}")
+                log.info(f"Using default voice: {voices[0].name}")
                 
         except Exception as e:
-            logging.warning(f"Failed to set voice: {e}")
+            log.warning(f"Failed to set voice: {e}")
     
     def _start_worker(self):
         """Start the TTS worker thread"""
@@ -99,135 +159,281 @@ class TTSManager:
         self.is_running = True
         self.worker_thread = threading.Thread(target=self._speech_worker, daemon=True)
         self.worker_thread.start()
-        logging.info("TTS worker thread started")
+        log.info("TTS worker thread started")
     
     def _speech_worker(self):
         """Worker thread for processing speech queue"""
-        logging.info("TTS worker thread running")
+        log.info("TTS worker thread running")
         
         # On macOS, prioritize system 'say' command for reliability
-        import platform
-        use_system_say = platform.system() == "Darwin"
+        use_system_say = _IS_DARWIN
         
-        # Create a new engine instance for this thread only if not using system say
-        thread_engine = None
-        if not use_system_say:
-            try:
-                import pyttsx3
-                thread_engine = pyttsx3.init()
-                if thread_engine:
-                    thread_engine.setProperty('rate', TTS_RATE)  # Use config value
-                    thread_engine.setProperty('volume', TTS_VOLUME)
-                    # Copy voice settings from main engine
-                    if self.engine:
-                        try:
-                            main_voice = self.engine.getProperty('voice')
-                            thread_engine.setProperty('voice', main_voice)
-                        except:
-                            pass
-            except Exception as e:
-                logging.warning(f"Could not create thread TTS engine: {e}")
-                thread_engine = None
+        # On Windows, drive SAPI directly; its blocking Speak call releases the GIL
+        sapi_voice = self._create_sapi_voice() if _SYSTEM == "Windows" else None
+        
+        # Otherwise speak through the shared pyttsx3 engine (pyttsx3.init() caches one
+        # engine per driver, so a "thread engine" would be this same object anyway)
+        use_engine = False
+        if not use_system_say and sapi_voice is None:
+            use_engine = self._connect_preempt()
+            if not use_engine:
                 use_system_say = True  # Fall back to system say
         
+        # Engine rebuilds after speech errors back off exponentially, then give up
+        reinit_failures = 0
+        next_reinit_ok = 0.0
+        
         while self.is_running:
             try:
-                # Get speech request from queue with timeout
-                text = self.speech_queue.get(timeout=1.0)
+                # Sleep until the producer signals, then take up to 3 queued phrases
+                # so they share one speech invocation
+                with self._queue_cv:
+                    while not self.speech_queue and self.is_running:
+                        self._queue_cv.wait()
+                    if not self.is_running:
+                        break
+                    items = [self.speech_queue.popleft() for _ in range(min(len(self.speech_queue), 3))]
+                    batch_gen = self._speaking_gen = self._gen
+                    self._speaking_topic = items[-1][2]
                 
-                if text and self.available:
+                texts = [text for text, _, _ in items]
+                if texts and self.available:
+                    text = " ".join(t if t[-1] in ".!?" else t + "." for t in texts)
+                    self._speaking.set()
                     try:
-                        logging.info(f"🔊 Speaking: {text}")
+                        log.info("🔊 Speaking: %s", text)
                         if use_system_say:
-                            # Use macOS system say command (most reliable)
-                            import subprocess
-                            result = subprocess.run(
-                                ["say", "-r", str(TTS_RATE), text], 
-                                capture_output=True, 
-                                timeout=10
-                            )
-                            if result.returncode == 0:
-                                logging.info("✅ TTS speech completed successfully (system say)")
+                            # Use macOS system say command (most reliable). Launch and publish the
+                            # process under the queue lock, so a producer either sees it or has
+                            # already cancelled this batch.
+                            with self._queue_cv:
+                                say_proc = None
+                                if self._cancel_gen != batch_gen:
+                                    say_proc = subprocess.Popen(
+                                        _SAY_CMD_PREFIX + [text],
+                                        stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL,
+                                        close_fds=False
+                                    )
+                                    self._say_proc = say_proc
+                                    self._say_proc_gen = batch_gen
+                            if say_proc is None:
+                                log.debug("Stale speech preempted by a newer request")
                             else:
-                                logging.warning(f"System say failed: {result.stderr}")
-                        elif thread_engine:
-                            thread_engine.say(text)
-                            thread_engine.runAndWait()
-                            logging.info("✅ TTS speech completed successfully (pyttsx3)")
+                                try:
+                                    returncode = say_proc.wait(timeout=10 * len(texts))
+                                except subprocess.TimeoutExpired:
+                                    say_proc.kill()
+                                    returncode = say_proc.wait()
+                                if returncode == 0:
+                                    log.info("✅ TTS speech completed successfully (system say)")
+                                elif self._cancel_gen == batch_gen:
+                                    log.debug("Stale speech preempted by a newer request")
+                                else:
+                                    log.warning(f"System say failed with exit code {returncode}")
+                        elif sapi_voice is not None:
+                            sapi_voice.Speak(text, 0)
+                            log.info("✅ TTS speech completed successfully (SAPI)")
+                        elif use_engine:
+                            # Voice changes and shutdown wait for the utterance to finish
+                            with self._engine_lock:
+                                if self.engine is not None:
+                                    self.engine.say(text)
+                                    self.engine.runAndWait()
+                            log.info("✅ TTS speech completed successfully (pyttsx3)")
                         else:
-                            logging.warning("⚠️ No TTS method available")
+                            log.warning("⚠️ No TTS method available")
+                        reinit_failures = 0
                     except Exception as speech_error:
-                        logging.error(f"❌ TTS speech error: {speech_error}")
+                        log.error(f"❌ TTS speech error: {speech_error}")
                         # Don't stop the worker, just skip this speech
+                        if use_engine:
+                            now = time.monotonic()
+                            if now >= next_reinit_ok:
+                                reinit_failures += 1
+                                next_reinit_ok = now + min(30.0, 0.5 * 2 ** reinit_failures)
+                                if reinit_failures > 5:
+                                    log.error("TTS engine keeps failing - disabling speech")
+                                    self.available = False
+                                elif not self._rebuild_engine():
+                                    log.error("TTS engine could not be rebuilt - disabling speech")
+                                    self.available = False
+                    finally:
+                        self._speaking.clear()
                 
-                self.speech_queue.task_done()
+                # Release any speak_immediate callers waiting on this batch
+                for _, done, _ in items:
+                    if done is not None:
+                        done.set()
+                
+                if not self.available:
+                    break
                 
-            except queue.Empty:
-                continue
             except Exception as e:
-                logging.error(f"TTS worker error: {e}")
+                log.error(f"TTS worker error: {e}")
                 # Continue without breaking - TTS is not critical
                 continue
                 
-        # Clean up thread engine
-        if thread_engine:
-            try:
-                thread_engine.stop()
-            except:
-                pass
+        if sapi_voice is not None:
+            sapi_voice = None
+            import pythoncom
+            pythoncom.CoUninitialize()
                 
-        logging.info("TTS worker thread stopped")
+        log.info("TTS worker thread stopped")
     
-    def speak_async(self, text: str) -> bool:
-        """Add text to speech queue for async processing"""
-        if not text or not text.strip():
-            return False
-            
-        if not self.available:
-            logging.debug(f"TTS not available, skipping: {text[:50]}...")
-            return False
-        
+    def _connect_preempt(self) -> bool:
+        """Hook the shared engine so a cancelled utterance is abandoned; returns whether it is usable"""
         try:
-            # Clear queue if it's getting too full
-            if self.speech_queue.qsize() > 3:
+            with self._engine_lock:
+                engine = self.engine
+                if engine is None:
+                    return False
+                if self._preempt_token is not None:
+                    return True
+                
+                # Abandon an utterance as soon as a newer request cancels it
+                def _preempt_if_stale(name, location, length):
+                    if self._cancel_gen == self._speaking_gen:
+                        engine.stop()
+                self._preempt_token = engine.connect('started-word', _preempt_if_stale)
+            return True
+        except Exception as e:
+            log.warning(f"Could not hook TTS engine for preemption: {e}")
+            return False
+    
+    def _rebuild_engine(self) -> bool:
+        """Replace a failing engine with a freshly created driver, keeping the selected voice"""
+        with self._engine_lock:
+            engine, self.engine = self.engine, None
+            voice_id = None
+            if engine is not None:
                 try:
-                    with self.speech_queue.mutex:
-                        self.speech_queue.queue.clear()
-                    logging.debug("Cleared TTS queue due to backlog")
-                except:
+                    voice_id = engine.getProperty('voice')
+                    if self._preempt_token is not None:
+                        engine.disconnect(self._preempt_token)
+                except Exception:
                     pass
+            self._preempt_token = None
+            # pyttsx3.init() hands back its cached engine while one is alive; forget it
+            # so the next init builds a new driver
+            getattr(pyttsx3, "_activeEngines", {}).pop(None, None)
+            del engine
+        
+        if not self._initialize_engine():
+            return False
+        if voice_id is not None:
+            self.set_voice_by_id(voice_id)
+        return self._connect_preempt()
+    
+    def _create_sapi_voice(self):
+        """Create a SAPI voice for the worker thread, or None if COM is unavailable"""
+        try:
+            import pythoncom
+            import win32com.client
+            pythoncom.CoInitialize()
+            sapi_voice = win32com.client.Dispatch('SAPI.SpVoice')
+            sapi_voice.Volume = int(TTS_VOLUME * 100)
             
-            self.speech_queue.put(text, block=False)
-            logging.debug(f"Queued TTS: {text[:50]}...")
-            return True
+            # Copy voice settings from main engine
+            if self.engine:
+                with self._engine_lock:
+                    voice_id = self.engine.getProperty('voice')
+                for token in sapi_voice.GetVoices():
+                    if token.Id == voice_id:
+                        sapi_voice.Voice = token
+                        break
             
-        except queue.Full:
-            logging.warning("TTS queue is full, dropping speech request")
-            return False
+            # Words-per-minute to SAPI Rate the way pyttsx3's sapi5 driver does it: a per-voice
+            # log curve, falling back to MSMary's for voices it doesn't list
+            try:
+                from pyttsx3.drivers.sapi5 import E_REG, MSMARY
+                a, b = E_REG.get(sapi_voice.Voice.Id, E_REG[MSMARY])
+            except Exception:
+                a, b = 156.63, 1.11
+            sapi_voice.Rate = max(-10, min(10, int(math.log(TTS_RATE / a, b))))
+            return sapi_voice
         except Exception as e:
-            logging.error(f"Failed to queue speech: {e}")
+            log.warning(f"Could not create SAPI voice: {e}")
+            return None
+    
+    def speak_async(self, text: str, topic: Optional[str] = None) -> bool:
+        """Add text to speech queue for async processing (newest wins; same-topic speech is not cut off)"""
+        # Cheapest rejection first: a single attribute load when TTS is down or still starting
+        if not self.available or not self._init_done.is_set():
+            return False
+        
+        if not text or not text.strip():
             return False
+        
+        if TTS_BATCH_UTTERANCES:
+            # Keep the backlog; the worker speaks it in batches
+            with self._queue_cv:
+                self.speech_queue.append((text, None, topic))
+                self._queue_cv.notify()
+        else:
+            with self._queue_cv:
+                # Newest request wins; anything still pending is stale
+                self._drop_pending()
+                self.speech_queue.append((text, None, topic))
+                self._gen += 1
+                # Let a phrase on the same topic finish; the new one follows it
+                if topic is None or topic != self._speaking_topic:
+                    self._preempt_speaking()
+                self._queue_cv.notify()
+        log.debug("Queued TTS: %.50s...", text)
+        return True
     
     def speak_immediate(self, text: str) -> bool:
         """Speak text immediately (blocking)"""
-        if not self.available or not text.strip() or not self.engine:
+        if not self.available or not text.strip() or not self.is_running:
             return False
         
-        try:
-            self.engine.say(text)
-            self.engine.runAndWait()
-            return True
-        except Exception as e:
-            logging.error(f"Immediate speech failed: {e}")
+        # Hand off to the worker ahead of any backlog and wait for it to finish;
+        # Event.wait releases the GIL so frame capture keeps running meanwhile
+        done = threading.Event()
+        with self._queue_cv:
+            self._drop_pending()
+            self.speech_queue.append((text, done, None))
+            self._gen += 1
+            self._preempt_speaking()
+            self._queue_cv.notify()
+        
+        if not done.wait(timeout=10):
+            log.error("Immediate speech timed out")
             return False
+        return True
     
     def clear_queue(self):
         """Clear all pending speech requests"""
-        try:
-            with self.speech_queue.mutex:
-                self.speech_queue.queue.clear()
-        except Exception as e:
-            logging.warning(f"Failed to clear TTS queue: {e}")
+        with self._queue_cv:
+            self._drop_pending()
+    
+    def _preempt_speaking(self):
+        """Cut off the batch being spoken (caller holds the lock)"""
+        self._cancel_gen = self._speaking_gen
+        # The lock keeps the worker from launching the new request yet, so a running
+        # process from an older generation is always the stale one
+        say_proc = self._say_proc
+        if say_proc is not None and self._say_proc_gen < self._gen and say_proc.poll() is None:
+            say_proc.terminate()
+    
+    def _drop_pending(self):
+        """Discard queued requests, releasing any speak_immediate waiters (caller holds the lock)"""
+        for _, done, _ in self.speech_queue:
+            if done is not None:
+                done.set()
+        self.speech_queue.clear()
+    
+    def _get_voices(self) -> list:
+        """Get installed voices, enumerating them from the driver only once (caller holds the engine lock)"""
+        if self._voices_cache is None:
+            self._voices_cache = list(self.engine.getProperty('voices') or ())
+        return self._voices_cache
+    
+    def invalidate_voice_cache(self):
+        """Forget cached voices so they are enumerated again (e.g. after re-initialization)"""
+        self._voices_cache = None
+        self._voice_info_cache = None
     
     def get_available_voices(self) -> List[Dict]:
         """Get list of available voices"""
@@ -235,22 +441,22 @@ class TTSManager:
             return []
         
         try:
-            voices = self.engine.getProperty('voices')
-            voice_list = []
-            
-            for voice in voices:
-                voice_info = {
-                    'id': voice.id,
-                    'name': voice.name if voice.name else 'Unknown',
-                    'languages': getattr(voice, 'languages', []),
-                    'gender': getattr(voice, 'gender', 'Unknown')
-                }
-                voice_list.append(voice_info)
-            
-            return voice_list
+            with self._engine_lock:
+                if self._voice_info_cache is None:
+                    self._voice_info_cache = [
+                        {
+                            'id': voice.id,
+                            'name': voice.name if voice.name else 'Unknown',
+                            'languages': getattr(voice, 'languages', []),
+                            'gender': getattr(voice, 'gender', 'Unknown')
+                        }
+                        for voice in self._get_voices()
+                    ]
+                
+                return list(self._voice_info_cache)
             
         except Exception as e:
-            logging.error(f"Failed to get voices: {e}")
+            log.error(f"Failed to get voices: {e}")
             return []
     
     def set_voice_by_id(self, voice_id: str) -> bool:
@@ -259,181 +465,243 @@ class TTSManager:
             return False
         
         try:
-            voices = self.engine.getProperty('voices')
-            for voice in voices:
-                if voice.id == voice_id:
-                    self.engine.setProperty('voice', voice_id)
-                    self.current_voice = voice.name
-                    logging.info(f"Voice changed to: {voice.name}")
-                    return True
+            with self._engine_lock:
+                for voice in self._get_voices():
+                    if voice.id == voice_id:
+                        self.engine.setProperty('voice', voice_id)
+                        self.current_voice = voice.name
+                        log.info(f"Voice changed to: {voice.name}")
+                        return True
             return False
         except Exception as e:
-            logging.error(f"Failed to set voice: {e}")
+            log.error(f"Failed to set voice: {e}")
             return False
     
     def stop(self):
         """Stop the TTS manager"""
-        logging.info("Stopping TTS manager...")
-        self.is_running = False
-        self.clear_queue()
+        log.info("Stopping TTS manager...")
+        self._init_done.wait(timeout=2.0)
+        with self._queue_cv:
+            self.is_running = False
+            self._drop_pending()
+            # Cut off any utterance still playing so the worker can exit promptly
+            self._cancel_gen = self._speaking_gen
+            say_proc = self._say_proc
+            if say_proc is not None and say_proc.poll() is None:
+                say_proc.terminate()
+            self._queue_cv.notify_all()
         
         if self.worker_thread and self.worker_thread.is_alive():
             self.worker_thread.join(timeout=2.0)
         
-        if self.engine:
+        # No engine.stop(): a cancelled utterance already stops itself at the next word, and
+        # on some drivers (eSpeak) stop() can block indefinitely. The worker holds the engine
+        # lock while speaking, so don't wait on it forever; the daemon ends with the process.
+        if self._speaking.is_set():
+            log.warning("TTS worker still speaking at shutdown - leaving it to exit with the process")
+        if self._engine_lock.acquire(timeout=1.0):
             try:
-                self.engine.stop()
-            except Exception as e:
-                logging.warning(f"Error stopping TTS engine: {e}")
+                self.engine = None
+                self._preempt_token = None
+            finally:
+                self._engine_lock.release()
         
-        logging.info("TTS manager stopped")
+        log.info("TTS manager stopped")
 
 
 ########################################
 # EMOTION FEEDBACK MANAGER
 ########################################
+# Message pools, built once at import
+_COMPLIMENT_POOLS = {emotion: tuple(options) for emotion, options in COMPLIMENTS.items()}
+_NEUTRAL_COMPLIMENTS = _COMPLIMENT_POOLS['neutral']
+_NO_FACE_MESSAGES = (
+    "I'm here when you're ready! 👋",
+    "Looking for your beautiful face! 😊",
+    "Come back when you're ready to smile! ✨",
+    "Waiting to see that wonderful expression! 🌟"
+)
+# Shared read-only result when no emotion is being tracked
+_EMPTY_STABILITY = MappingProxyType({})
+
 class EmotionFeedbackManager:
     """Manages emotion-based feedback with intelligent timing"""
     
+    __slots__ = (
+        "tts", "_tracked_emotion", "_tracked_start_ns", "_stability_threshold",
+        "_rng", "_idx",
+        "_cooldown_ns", "_no_face_cooldown_ns", "_stab_ns", "_now_ns",
+        "_last_compliment_ns", "_last_no_face_ns"
+    )
+    
     def __init__(self, tts_manager: TTSManager):
         self.tts = tts_manager
-        self.last_compliment_time = 0
-        self.last_no_face_message_time = 0
-        self.consecutive_emotions = {}
+        # Currently tracked emotion and when it started ("" when nothing is tracked)
+        self._tracked_emotion = ""
+        self._tracked_start_ns = 0
         self.emotion_stability_threshold = 1  # Reduced from 2 to 1 second for easier testing
-        self.last_emotion_change_time = time.time()
+        
+        # Private RNG for picking from the module-level message pools
+        self._rng = random.Random()
+        # Per-emotion round-robin position in the compliment tuples
+        self._idx = {}
+        
+        # Integer nanosecond thresholds, compared against the per-frame clock from tick()
+        self._cooldown_ns = int(COMPLIMENT_COOLDOWN * 1e9)
+        self._no_face_cooldown_ns = int(NO_FACE_COOLDOWN * 1e9)
+        self._now_ns = time.monotonic_ns()
+        self._last_compliment_ns = self._now_ns - self._cooldown_ns
+        self._last_no_face_ns = self._now_ns - self._no_face_cooldown_ns
+    
+    @property
+    def emotion_stability_threshold(self) -> float:
+        """Seconds an emotion must hold before it earns a compliment"""
+        return self._stability_threshold
+    
+    @emotion_stability_threshold.setter
+    def emotion_stability_threshold(self, seconds: float):
+        self._stability_threshold = seconds
+        self._stab_ns = int(seconds * 1e9)
+    
+    def tick(self, now_ns: int):
+        """Cache the monotonic clock once per frame"""
+        self._now_ns = now_ns
         
     def should_give_compliment(self, emotion: str, confidence: float) -> bool:
         """Determine if a compliment should be given"""
-        current_time = time.time()
+        now_ns = self._now_ns
         
-        # Check cooldown
-        time_since_last = current_time - self.last_compliment_time
-        if time_since_last < COMPLIMENT_COOLDOWN:
-            logging.debug(f"Compliment blocked by cooldown: {time_since_last:.1f}s < {COMPLIMENT_COOLDOWN}s")
+        # Most frames are rejected for stability, so check that first
+        if emotion != self._tracked_emotion:
+            if confidence >= 0.6:
+                self._tracked_emotion = emotion
+                self._tracked_start_ns = now_ns
+                log.debug("Starting emotion tracking for %s", emotion)
+            return False
+        
+        emotion_duration_ns = now_ns - self._tracked_start_ns
+        if emotion_duration_ns < self._stab_ns:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Emotion %s not stable enough: %.1fs < %ss", emotion, emotion_duration_ns / 1e9, self.emotion_stability_threshold)
             return False
         
         # Check confidence threshold
         if confidence < 0.6:
-            logging.debug(f"Compliment blocked by low confidence: {confidence:.2f} < 0.6")
+            log.debug("Compliment blocked by low confidence: %.2f < 0.6", confidence)
             return False
         
-        # Track emotion stability
-        if emotion not in self.consecutive_emotions:
-            self.consecutive_emotions[emotion] = current_time
-            logging.debug(f"Starting emotion tracking for {emotion}")
+        # Check cooldown
+        time_since_last_ns = now_ns - self._last_compliment_ns
+        if time_since_last_ns < self._cooldown_ns:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Compliment blocked by cooldown: %.1fs < %ss", time_since_last_ns / 1e9, COMPLIMENT_COOLDOWN)
             return False
         
-        # Check if emotion has been stable long enough
-        emotion_duration = current_time - self.consecutive_emotions[emotion]
-        if emotion_duration >= self.emotion_stability_threshold:
-            logging.info(f"✅ Compliment approved! Emotion {emotion} stable for {emotion_duration:.1f}s (confidence: {confidence:.2f})")
-            return True
-        else:
-            logging.debug(f"Emotion {emotion} not stable enough: {emotion_duration:.1f}s < {self.emotion_stability_threshold}s")
-        
-        return False
+        log.info("✅ Compliment approved! Emotion %s stable for %.1fs (confidence: %.2f)", emotion, emotion_duration_ns / 1e9, confidence)
+        return True
     
     def give_compliment(self, emotion: str, confidence: float) -> Optional[str]:
         """Give appropriate compliment for the emotion"""
+        if not self.should_give_compliment(emotion, confidence):
+            return None
+        
+        return self._deliver_compliment(emotion)
+    
+    def process_frame(self, emotion: str, confidence: float, now_ns: int) -> Optional[str]:
+        """Update emotion tracking and give a compliment if one is due, in a single pass"""
+        # Plain compares on caller-supplied str/float/int; only the speech hand-off can raise
+        self._now_ns = now_ns
+        
+        # Low confidence clears tracking; a new emotion restarts it
+        if confidence < 0.6:
+            self._tracked_emotion = ""
+            return None
+        if emotion != self._tracked_emotion:
+            self._tracked_emotion = emotion
+            self._tracked_start_ns = now_ns
+            return None
+        
+        # Wait for stability, then for the cooldown
+        if now_ns - self._tracked_start_ns < self._stab_ns:
+            return None
+        if now_ns - self._last_compliment_ns < self._cooldown_ns:
+            return None
+        
+        log.info("✅ Compliment approved! Emotion %s stable for %.1fs (confidence: %.2f)", emotion, (now_ns - self._tracked_start_ns) / 1e9, confidence)
+        return self._deliver_compliment(emotion)
+    
+    def _deliver_compliment(self, emotion: str) -> str:
+        """Pick a compliment, reset timing and tracking, and queue it for speech"""
+        options = _COMPLIMENT_POOLS.get(emotion, _NEUTRAL_COMPLIMENTS)
+        # Round-robin never repeats a compliment before the whole pool has been used
+        compliment = self._next_compliment(emotion, options)
+        
+        # No emoji decorations - keep compliments clean for TTS
+        
+        # Update timing
+        self._last_compliment_ns = self._now_ns
+        
+        # Reset emotion tracking
+        self._tracked_emotion = ""
+        
+        # Queue for speech (non-blocking)
+        if self._speak(compliment, emotion):
+            log.info("Compliment given: %s", compliment)
+        else:
+            log.debug("Compliment shown (TTS unavailable): %s", compliment)
+        
+        return compliment
+    
+    def _next_compliment(self, emotion: str, options: tuple) -> str:
+        """Cycle through the compliments for an emotion in order"""
+        i = self._idx.get(emotion, 0)
+        self._idx[emotion] = i + 1
+        return options[i % len(options)]
+    
+    def _speak(self, text: str, topic: str) -> bool:
+        """Queue text for speech, never letting a TTS failure reach the frame loop"""
+        if not self.tts.available:
+            return False
         try:
-            if not self.should_give_compliment(emotion, confidence):
-                return None
-            
-            compliments = COMPLIMENTS.get(emotion, COMPLIMENTS['neutral'])
-            compliment = random.choice(compliments)
-            
-            # No emoji decorations - keep compliments clean for TTS
-            
-            # Update timing
-            self.last_compliment_time = time.time()
-            
-            # Reset emotion tracking
-            self.consecutive_emotions.clear()
-            
-            # Queue for speech (non-blocking)
-            success = self.tts.speak_async(compliment)
-            if success:
-                logging.info(f"Compliment given: {compliment}")
-            else:
-                logging.debug(f"Compliment shown (TTS unavailable): {compliment}")
-            
-            return compliment
-            
+            return self.tts.speak_async(text, topic)
         except Exception as e:
-            logging.error(f"Error giving compliment: {e}")
-            return None
+            log.error(f"Failed to queue speech: {e}")
+            return False
     
     def handle_no_face_detected(self) -> Optional[str]:
         """Handle when no face is detected"""
-        try:
-            current_time = time.time()
-            
-            if current_time - self.last_no_face_message_time < NO_FACE_COOLDOWN:
-                return None
-            
-            messages = [
-                "I'm here when you're ready! 👋",
-                "Looking for your beautiful face! 😊",
-                "Come back when you're ready to smile! ✨",
-                "Waiting to see that wonderful expression! 🌟"
-            ]
-            
-            message = random.choice(messages)
-            self.last_no_face_message_time = current_time
-            
-            # Queue for speech (non-blocking)
-            self.tts.speak_async(message)
-            
-            return message
-            
-        except Exception as e:
-            logging.error(f"Error handling no face: {e}")
+        if self._now_ns - self._last_no_face_ns < self._no_face_cooldown_ns:
             return None
+        
+        message = self._rng.choice(_NO_FACE_MESSAGES)
+        self._last_no_face_ns = self._now_ns
+        
+        # Queue for speech (non-blocking)
+        self._speak(message, "no_face")
+        
+        return message
     
     def update_emotion_tracking(self, emotion: str, confidence: float):
         """Update emotion tracking for stability analysis"""
-        try:
-            current_time = time.time()
-            
-            # Clear tracking for low confidence emotions
-            if confidence < 0.6:
-                self.consecutive_emotions.clear()
-                return
-            
-            # If emotion changed, reset tracking
-            if emotion not in self.consecutive_emotions:
-                self.consecutive_emotions.clear()
-                self.consecutive_emotions[emotion] = current_time
-                self.last_emotion_change_time = current_time
-            
-            # Clean up old emotions
-            emotions_to_remove = []
-            for tracked_emotion, start_time in self.consecutive_emotions.items():
-                if tracked_emotion != emotion and current_time - start_time > 1.0:
-                    emotions_to_remove.append(tracked_emotion)
-            
-            for old_emotion in emotions_to_remove:
-                del self.consecutive_emotions[old_emotion]
-                
-        except Exception as e:
-            logging.error(f"Error updating emotion tracking: {e}")
+        # Clear tracking for low confidence emotions
+        if confidence < 0.6:
+            self._tracked_emotion = ""
+            return
+        
+        # If emotion changed, reset tracking
+        if emotion != self._tracked_emotion:
+            self._tracked_emotion = emotion
+            self._tracked_start_ns = self._now_ns
     
     def get_emotion_stability_info(self) -> Dict:
         """Get current emotion stability information"""
-        try:
-            current_time = time.time()
-            stability_info = {}
-            
-            for emotion, start_time in self.consecutive_emotions.items():
-                duration = current_time - start_time
-                stability_info[emotion] = {
-                    'duration': duration,
-                    'stable': duration >= self.emotion_stability_threshold
-                }
-            
-            return stability_info
-            
-        except Exception as e:
-            logging.error(f"Error getting stability info: {e}")
-            return {} 
\ No newline at end of file
+        if not self._tracked_emotion:
+            return _EMPTY_STABILITY
+        
+        duration_ns = self._now_ns - self._tracked_start_ns
+        return {
+            self._tracked_emotion: {
+                'duration': duration_ns / 1e9,
+                'stable': duration_ns >= self._stab_ns
+            }
+        }
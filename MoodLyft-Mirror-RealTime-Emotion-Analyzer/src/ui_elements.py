@@ -1,12 +1,183 @@
 import cv2
 import numpy as np
 import random
+import time
+from itertools import cycle
 from typing import Tuple, Dict, Optional, List
 from PIL import Image, ImageDraw, ImageFont
 from collections import deque
+from functools import lru_cache
 
 from .animation import AnimationManager
-from .config import COLOR_MAP, EMOJIS, UI_BORDER_THICKNESS, UI_CONFIDENCE_BAR_HEIGHT
+from .config import (
+    COLOR_MAP, EMOJIS, UI_BORDER_THICKNESS, UI_CONFIDENCE_BAR_HEIGHT, BORDER_GLOW
+)
+from .utils import get_font
+
+_RNG = np.random.default_rng()
+
+# Each emotion's emojis in a shuffled order, cycled so picking one needs no RNG draw
+_EMOJI_ITERS = {emotion: cycle(random.sample(emojis, len(emojis))) for emotion, emojis in EMOJIS.items()}
+
+# Optional: numba compiles the glassmorphism pixel kernel
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _glass_kernel(out, noise, base):
+        """Write clip(base * row_gradient + noise) as uint8 into out, rows in parallel"""
+        height, width = noise.shape
+        for y in prange(height):
+            alpha = 0.7 + 0.3 * y / height
+            for x in range(width):
+                n = noise[y, x]
+                for c in range(3):
+                    out[y, x, c] = np.uint8(min(max(base[c] * alpha + n, 0.0), 255.0))
+else:
+    _glass_kernel = None
+
+
+@lru_cache(maxsize=64)
+def _rounded_rect_polygon(w: int, h: int, radius: int) -> np.ndarray:
+    """Rounded rectangle outline at the origin as one int32 contour (cached per size)"""
+    r = max(0, min(radius, w // 2, h // 2))
+    corners = (
+        ((r, r), 180),           # top-left
+        ((w - r, r), 270),       # top-right
+        ((w - r, h - r), 0),     # bottom-right
+        ((r, h - r), 90),        # bottom-left
+    )
+    poly = np.concatenate([
+        cv2.ellipse2Poly(center, (r, r), 0, start, start + 90, 5) for center, start in corners
+    ]).astype(np.int32)
+    poly.flags.writeable = False
+    return poly
+
+
+@lru_cache(maxsize=32)
+def _glow_mask(w: int, h: int, thickness: int) -> np.ndarray:
+    """Blurred float32 border ring for a w x h box, padded by 2*thickness and peaking at 1.0"""
+    pad = thickness * 2
+    mask = np.zeros((h + 2 * pad + 1, w + 2 * pad + 1), dtype=np.float32)
+    cv2.rectangle(mask, (pad, pad), (pad + w, pad + h), 1.0, thickness)
+    mask = cv2.GaussianBlur(mask, (0, 0), thickness)
+    mask *= 1.0 / max(float(mask.max()), 1e-6)
+    mask.flags.writeable = False
+    return mask
+
+
+@lru_cache(maxsize=256)
+def _text_bbox(text: str, font: ImageFont.ImageFont) -> Tuple[int, int, int, int]:
+    """Cached font.getbbox; fonts come from the get_font cache so identity keys are stable"""
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=128)
+def _hershey_text_size(text: str, scale: float, thickness: int) -> Tuple[int, int]:
+    """Cached cv2.getTextSize for the simplex Hershey font"""
+    return cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)[0]
+
+
+@lru_cache(maxsize=32)
+def _render_compliment_sprite(text: str, font: ImageFont.ImageFont) -> Tuple[np.ndarray, int, int, int]:
+    """Render the compliment panel and text once as (bgra_sprite, text_w, text_h, margin)"""
+    lines = text.split('\n')
+    bboxes = [_text_bbox(line, font) for line in lines]
+    line_widths = [b[2] - b[0] for b in bboxes]
+    line_heights = [b[3] - b[1] for b in bboxes]
+    max_width = max(line_widths)
+    total_height = sum(line_heights) + (len(lines) - 1) * 5
+    
+    # Glassmorphism panel: three layers, each 2px larger than the last
+    padding = 20
+    margin = padding + 4
+    img = Image.new('RGBA', (max_width + 2 * margin + 1, total_height + 2 * margin + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for layer in range(3):
+        inset = margin - padding - layer * 2
+        draw.rounded_rectangle(
+            [inset, inset, 2 * margin + max_width - inset, 2 * margin + total_height - inset],
+            radius=25 + layer * 2, fill=(30 + layer * 10, 35 + layer * 10, 50 + layer * 10, 255)
+        )
+    
+    # Text lines with layered drop shadows
+    current_y = margin
+    for line, line_w, line_h in zip(lines, line_widths, line_heights):
+        line_x = margin + (max_width - line_w) // 2
+        for shadow_offset in range(3, 0, -1):
+            draw.text((line_x + shadow_offset, current_y + shadow_offset), line, font=font, fill=(0, 0, 0, 255))
+        draw.text((line_x, current_y), line, font=font, fill=(255, 255, 255, 255))
+        current_y += line_h + 5
+    
+    sprite = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGBA2BGRA)
+    sprite.flags.writeable = False
+    return sprite, max_width, total_height, margin
+
+
+@lru_cache(maxsize=1)
+def _render_title_sprite() -> Tuple[np.ndarray, int, int]:
+    """Render the two-line app title once as (bgra_sprite, origin_x, baseline_y)"""
+    lines = (
+        ("MoodLyft Mirror", 0, 1.2, (255, 255, 255), 2),
+        ("Real-time Emotion Analysis", 25, 0.6, (180, 180, 180), 1),
+    )
+    sizes = [cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thick) for text, _, scale, _, thick in lines]
+    ox, oy = 2, sizes[0][0][1] + 2
+    width = max(size[0] for size, _ in sizes) + 2 * ox
+    height = oy + lines[-1][1] + sizes[-1][1] + 2
+    
+    bgr = np.zeros((height, width, 3), dtype=np.uint8)
+    mask = np.zeros((height, width), dtype=np.uint8)
+    for text, dy, scale, color, thick in lines:
+        cv2.putText(bgr, text, (ox, oy + dy), cv2.FONT_HERSHEY_SIMPLEX, scale, color, thick)
+        cv2.putText(mask, text, (ox, oy + dy), cv2.FONT_HERSHEY_SIMPLEX, scale, 255, thick)
+    sprite = cv2.merge((*cv2.split(bgr), mask))
+    sprite.flags.writeable = False
+    return sprite, ox, oy
+
+
+@lru_cache(maxsize=32)
+def _render_label_sprite(label_text: str, confidence_text: str, bg_color: Tuple[int, int, int],
+                         font: ImageFont.ImageFont, small_font: ImageFont.ImageFont
+                         ) -> Tuple[np.ndarray, int, int, int]:
+    """Render an emotion label panel as (bgra_sprite, text_w, text_h, padding)"""
+    label_bbox = _text_bbox(label_text, font)
+    conf_bbox = _text_bbox(confidence_text, small_font)
+    label_w = label_bbox[2] - label_bbox[0]
+    label_h = label_bbox[3] - label_bbox[1]
+    conf_w = conf_bbox[2] - conf_bbox[0]
+    conf_h = conf_bbox[3] - conf_bbox[1]
+    text_w = max(label_w, conf_w)
+    total_height = label_h + conf_h + 10
+    
+    # Glassmorphism background sized to the text
+    padding = 15
+    bg_w = text_w + 2 * padding
+    bg_h = total_height + 2 * padding
+    img = Image.new('RGBA', (bg_w + 1, bg_h + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.rounded_rectangle([0, 0, bg_w, bg_h], radius=12, fill=(*bg_color, 255))
+    
+    # Label and confidence text, each with a drop shadow
+    shadow_offset = 2
+    conf_x = padding + (label_w - conf_w) // 2
+    conf_y = padding + label_h + 5
+    for (tx, ty), text, text_font in (((padding, padding), label_text, font),
+                                      ((conf_x, conf_y), confidence_text, small_font)):
+        draw.text((tx + shadow_offset, ty + shadow_offset), text, font=text_font, fill=(0, 0, 0, 255))
+        draw.text((tx, ty), text, font=text_font, fill=(255, 255, 255, 255))
+    
+    sprite = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGBA2BGRA)
+    sprite.flags.writeable = False
+    return sprite, text_w, total_height, padding
+
+
+def _scale_color(color: Tuple[int, int, int], intensities: np.ndarray) -> List[List[int]]:
+    """Color scaled by each intensity, truncated to ints like int(c * k), one entry per intensity"""
+    return np.outer(intensities, color).astype(np.int32).tolist()
 
 
 class ModernUIElements:
@@ -15,60 +186,125 @@ class ModernUIElements:
     def __init__(self):
         self.animation_manager = AnimationManager()
         self.particle_systems = []
+        self._emoji_cache = {}  # emotion -> (emoji, chosen_at)
+        self._scratch = {}  # name -> reusable scratch array, see _buf
+        # Route the full-frame blend through OpenCV's OpenCL (T-API) backend when it is available and enabled
+        self._use_umat = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        # Indexed by config.BORDER_GLOW / BORDER_WAVE / BORDER_PULSE
+        self._border_fns = (self._border_glow, self._border_wave, self._border_pulse)
+    
+    def _buf(self, key: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """Scratch array for key, reallocated only when the requested shape or dtype changes"""
+        buf = self._scratch.get(key)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._scratch[key] = buf
+        return buf
+    
+    def add_weighted(self, src1: np.ndarray, alpha: float, src2: np.ndarray, beta: float) -> np.ndarray:
+        """Full-frame cv2.addWeighted, via UMat when OpenCL is in use (too costly for small regions)"""
+        if not self._use_umat:
+            return cv2.addWeighted(src1, alpha, src2, beta, 0)
+        return cv2.addWeighted(cv2.UMat(src1), alpha, cv2.UMat(src2), beta, 0).get()
+    
+    def _alpha_blend_roi(self, bg: np.ndarray, fg_bgra: np.ndarray, opacity: float = 1.0) -> None:
+        """Alpha-composite a BGRA image (times opacity) onto a same-sized BGR region in place"""
+        shape = bg.shape[:2] + (3,)
+        fg = self._buf('blend_fg', shape, np.uint8)
+        alpha = self._buf('blend_alpha', shape, np.uint8)
+        tmp = self._buf('blend_tmp', shape, np.uint8)
+        
+        cv2.cvtColor(fg_bgra, cv2.COLOR_BGRA2BGR, dst=fg)
+        cv2.cvtColor(cv2.extractChannel(fg_bgra, 3), cv2.COLOR_GRAY2BGR, dst=alpha)
+        if opacity < 1.0:
+            cv2.convertScaleAbs(alpha, dst=alpha, alpha=opacity)
+        # fg * a/255 + bg * (255 - a)/255, all in saturating uint8 kernels
+        cv2.multiply(fg, alpha, dst=fg, scale=1 / 255.0)
+        cv2.bitwise_not(alpha, dst=alpha)
+        cv2.multiply(bg, alpha, dst=tmp, scale=1 / 255.0)
+        cv2.add(fg, tmp, dst=bg)
+    
+    def _alpha_blit(self, dst: np.ndarray, sprite: np.ndarray, x: int, y: int, opacity: float = 1.0) -> None:
+        """Alpha-composite a BGRA sprite onto a BGR image at (x, y), clipped to the image"""
+        sh, sw = sprite.shape[:2]
+        dh, dw = dst.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + sw, dw), min(y + sh, dh)
+        if x0 < x1 and y0 < y1:
+            self._alpha_blend_roi(dst[y0:y1, x0:x1], sprite[y0 - y:y1 - y, x0 - x:x1 - x], opacity)
     
     @staticmethod
     def create_glassmorphism_background(width: int, height: int, 
                                       base_color: Tuple[int, int, int], 
                                       opacity: float = 0.1) -> np.ndarray:
         """Creates a modern glassmorphism background effect"""
-        background = np.zeros((height, width, 3), dtype=np.uint8)
-        
-        # Create gradient with noise
-        for y in range(height):
-            for x in range(width):
-                # Add some noise for texture
-                noise = np.random.normal(0, 10)
-                alpha = (y / height) * 0.3 + 0.7
-                color = tuple(int(base_color[i] * alpha + noise) for i in range(3))
-                color = tuple(max(0, min(255, c)) for c in color)
-                background[y, x] = color
-        
-        return background
+        # Per-pixel noise for texture, shared by the three channels
+        noise = _RNG.standard_normal((height, width), dtype=np.float32)
+        noise *= 10
+        base = np.asarray(base_color, dtype=np.float32)
+        
+        if _glass_kernel is not None:
+            background = np.empty((height, width, 3), dtype=np.uint8)
+            _glass_kernel(background, noise, base)
+            return background
+        
+        # Vertical gradient from 0.7 to 1.0 of the base color
+        alpha = np.linspace(0.7, 1.0, height, endpoint=False, dtype=np.float32)[:, None, None]
+        background = base * alpha + noise[..., None]
+        np.clip(background, 0, 255, out=background)
+        return background.astype(np.uint8)
     
     def create_animated_border(self, img: np.ndarray, x: int, y: int, 
                              w: int, h: int, color: Tuple[int, int, int], 
-                             thickness: int = UI_BORDER_THICKNESS, style: str = "glow") -> None:
-        """Creates beautiful animated borders with multiple styles"""
-        if style == "glow":
-            # Smooth breathing glow effect
-            breath = self.animation_manager.create_breath_animation(3.0)
-            pulse = self.animation_manager.create_pulse_animation(2.5, 0.6)
-            intensity = 0.4 + 0.6 * breath + 0.2 * pulse
-            
-            # Multi-layer glow effect
-            for i in range(thickness * 2):
-                layer_intensity = intensity * (1.0 - (i / (thickness * 2))) ** 0.5
-                border_color = tuple(int(c * layer_intensity) for c in color)
-                offset = i // 2
-                cv2.rectangle(img, (x - offset, y - offset), (x + w + offset, y + h + offset), border_color, 1)
-        
-        elif style == "wave":
-            # Flowing wave border
-            for i in range(thickness):
-                wave = self.animation_manager.create_wave_animation(x + i, y + i, i * 0.1, 0.8)
-                intensity = 0.3 + 0.7 * wave
-                border_color = tuple(int(c * intensity) for c in color)
-                cv2.rectangle(img, (x - i, y - i), (x + w + i, y + h + i), border_color, 1)
-        
-        elif style == "pulse":
-            # Sharp pulsing effect
-            pulse = self.animation_manager.create_pulse_animation(1.5, 1.2)
-            eased_pulse = self.animation_manager.ease_out_back(pulse)
-            
-            for i in range(thickness):
-                intensity = eased_pulse * (1.0 - (i / thickness))
-                border_color = tuple(int(c * intensity) for c in color)
-                cv2.rectangle(img, (x - i, y - i), (x + w + i, y + h + i), border_color, 2)
+                             thickness: int = UI_BORDER_THICKNESS, style: int = BORDER_GLOW) -> None:
+        """Creates beautiful animated borders with multiple styles (config.BORDER_*)"""
+        # Outer layers reach 2*thickness past the box; nothing to draw if that is all off-screen
+        pad = thickness * 2
+        img_h, img_w = img.shape[:2]
+        if x + w + pad < 0 or y + h + pad < 0 or x - pad >= img_w or y - pad >= img_h:
+            return
+        self._border_fns[style](img, x, y, w, h, color, thickness)
+    
+    def _border_glow(self, img: np.ndarray, x: int, y: int, w: int, h: int,
+                     color: Tuple[int, int, int], thickness: int) -> None:
+        """Smooth breathing glow effect"""
+        breath = self.animation_manager.create_breath_animation(3.0)
+        pulse = self.animation_manager.create_pulse_animation(2.5, 0.6)
+        intensity = 0.4 + 0.6 * breath + 0.2 * pulse
+        
+        # Soft glow: add a blurred border ring, scaled by the animated color, onto the region
+        pad = thickness * 2
+        img_h, img_w = img.shape[:2]
+        x0, y0 = max(x - pad, 0), max(y - pad, 0)
+        x1, y1 = min(x + w + pad + 1, img_w), min(y + h + pad + 1, img_h)
+        if x0 < x1 and y0 < y1:
+            mx, my = x0 - (x - pad), y0 - (y - pad)
+            mask = _glow_mask(w, h, thickness)[my:my + y1 - y0, mx:mx + x1 - x0]
+            roi = img[y0:y1, x0:x1]
+            glow = self._buf('glow', roi.shape, np.float32)
+            np.multiply(mask[..., None], intensity * np.asarray(color, dtype=np.float32), out=glow)
+            glow += roi
+            np.clip(glow, 0, 255, out=glow)
+            roi[:] = glow
+    
+    def _border_wave(self, img: np.ndarray, x: int, y: int, w: int, h: int,
+                     color: Tuple[int, int, int], thickness: int) -> None:
+        """Flowing wave border"""
+        layers = np.arange(thickness)
+        waves = self.animation_manager.create_wave_field(x + layers, y + layers, layers * 0.1, 0.8)
+        colors = _scale_color(color, 0.3 + 0.7 * waves)
+        for i, border_color in enumerate(colors):
+            cv2.rectangle(img, (x - i, y - i), (x + w + i, y + h + i), border_color, 1)
+    
+    def _border_pulse(self, img: np.ndarray, x: int, y: int, w: int, h: int,
+                      color: Tuple[int, int, int], thickness: int) -> None:
+        """Sharp pulsing effect"""
+        pulse = self.animation_manager.create_pulse_animation(1.5, 1.2)
+        eased_pulse = self.animation_manager.ease_out_back(pulse)
+        
+        colors = _scale_color(color, eased_pulse * (1.0 - np.arange(thickness) / thickness))
+        for i, border_color in enumerate(colors):
+            cv2.rectangle(img, (x - i, y - i), (x + w + i, y + h + i), border_color, 2)
     
     def draw_modern_rounded_rect(self, img: np.ndarray, x: int, y: int, 
                                w: int, h: int, radius: int, 
@@ -76,21 +312,21 @@ class ModernUIElements:
                                border_color: Optional[Tuple[int, int, int]] = None,
                                alpha: float = 0.8) -> None:
         """Draws a modern rounded rectangle with glassmorphism effect"""
-        # Create overlay for alpha blending
-        overlay = img.copy()
-        
-        # Draw filled rounded rectangle
-        cv2.rectangle(overlay, (x + radius, y), (x + w - radius, y + h), color, -1)
-        cv2.rectangle(overlay, (x, y + radius), (x + w, y + h - radius), color, -1)
-        
-        # Corner circles
-        cv2.circle(overlay, (x + radius, y + radius), radius, color, -1)
-        cv2.circle(overlay, (x + w - radius, y + radius), radius, color, -1)
-        cv2.circle(overlay, (x + radius, y + h - radius), radius, color, -1)
-        cv2.circle(overlay, (x + w - radius, y + h - radius), radius, color, -1)
-        
-        # Blend with original image
-        cv2.addWeighted(overlay, alpha, img, 1 - alpha, 0, img)
+        # Only the region under the rectangle (clipped to the image) needs blending
+        img_h, img_w = img.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w + 1, img_w), min(y + h + 1, img_h)
+        if x0 < x1 and y0 < y1:
+            roi = img[y0:y1, x0:x1]
+            overlay = self._buf('rr_overlay', roi.shape, roi.dtype)
+            np.copyto(overlay, roi)
+            ox, oy = x - x0, y - y0
+            
+            # Draw filled rounded rectangle as a single polygon
+            cv2.fillPoly(overlay, [_rounded_rect_polygon(w, h, radius) + (ox, oy)], color)
+            
+            # Blend with original image (roi is a view, so this writes into img)
+            cv2.addWeighted(overlay, alpha, roi, 1 - alpha, 0, dst=roi)
         
         # Add border if specified
         if border_color:
@@ -100,14 +336,16 @@ class ModernUIElements:
                           width: int, height: int, confidence: float, 
                           color: Tuple[int, int, int], animated: bool = True) -> None:
         """Draws a beautiful animated confidence bar with gradient effects"""
-        # Enhanced background with subtle gradient
-        bg_gradient = np.zeros((height, width, 3), dtype=np.uint8)
-        for i in range(width):
-            intensity = 20 + int(10 * (i / width))
-            bg_gradient[:, i] = [intensity, intensity, intensity]
+        # Only the on-screen part of the bar is filled; skip it entirely when off-screen
+        img_h, img_w = img.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, img_w), min(y + height, img_h)
+        if x0 >= x1 or y0 >= y1:
+            return
         
-        # Apply background
-        img[y:y+height, x:x+width] = bg_gradient
+        # Enhanced background with subtle gradient
+        bg_row = (20 + (10 * np.arange(x0 - x, x1 - x)) // width).astype(np.uint8)
+        img[y0:y1, x0:x1] = bg_row[None, :, None]
         
         # Animated fill with smooth transitions
         fill_width = int(width * confidence)
@@ -120,28 +358,19 @@ class ModernUIElements:
         else:
             intensity_mult = 0.8
         
-        if fill_width > 0:
-            # Create gradient fill
-            fill_gradient = np.zeros((height, fill_width, 3), dtype=np.uint8)
+        fill_end = min(x + fill_width, x1)
+        if fill_width > 0 and fill_end > x0:
+            # Gradient from darker to lighter, computed for all visible columns at once
+            cols = np.arange(x0 - x, fill_end - x, dtype=np.float32)
+            final_intensity = (0.6 + 0.4 * cols / fill_width) * intensity_mult
             
-            for i in range(fill_width):
-                # Gradient from darker to lighter
-                gradient_progress = i / fill_width
-                base_intensity = 0.6 + 0.4 * gradient_progress
-                
-                if animated:
-                    # Add wave effect for more dynamic look
-                    wave = self.animation_manager.create_wave_animation(x + i, y, 0, 0.5)
-                    wave_intensity = 0.9 + 0.1 * wave
-                    final_intensity = base_intensity * intensity_mult * wave_intensity
-                else:
-                    final_intensity = base_intensity * intensity_mult
-                
-                animated_color = tuple(int(c * final_intensity) for c in color)
-                fill_gradient[:, i] = animated_color[::-1]  # BGR format
+            if animated:
+                # Add wave effect for more dynamic look
+                wave = self.animation_manager.create_wave_field(x + cols, y, 0, 0.5)
+                final_intensity *= 0.9 + 0.1 * wave
             
-            # Apply gradient fill
-            img[y:y+height, x:x+fill_width] = fill_gradient
+            fill_row = final_intensity[:, None] * np.asarray(color[::-1], dtype=np.float32)  # BGR format
+            img[y0:y1, x0:fill_end] = np.clip(fill_row, 0, 255).astype(np.uint8)
             
             # Add highlight line at the top
             highlight_color = tuple(min(255, int(c * 1.3)) for c in color)
@@ -149,7 +378,7 @@ class ModernUIElements:
         
         # Enhanced text with shadow
         text = f"{confidence:.0%}"
-        text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.35, 1)[0]
+        text_size = _hershey_text_size(text, 0.35, 1)
         text_x = x + (width - text_size[0]) // 2
         text_y = y + (height + text_size[1]) // 2
         
@@ -161,64 +390,30 @@ class ModernUIElements:
     def draw_enhanced_emotion_label(self, overlay: np.ndarray, emotion: str, confidence: float,
                                    x: int, y: int, w_box: int, color_scheme: Dict, fonts: Dict) -> None:
         """Draw enhanced emotion label with modern styling"""
-        # Convert to PIL for better text rendering
-        pil_img = Image.fromarray(cv2.cvtColor(overlay, cv2.COLOR_BGR2RGB))
-        draw = ImageDraw.Draw(pil_img)
-        
-        # Select random emoji from emotion set
-        emoji = random.choice(EMOJIS.get(emotion, ["😐"]))
+        # Next emoji from the emotion's shuffled set, held for a second so it doesn't flicker
+        now = time.monotonic()
+        emoji, chosen_at = self._emoji_cache.get(emotion, (None, 0.0))
+        if emoji is None or now - chosen_at > 1.0:
+            emojis = _EMOJI_ITERS.get(emotion)
+            emoji = next(emojis) if emojis is not None else "😐"
+            self._emoji_cache[emotion] = (emoji, now)
         label_text = f"{emoji} {emotion.title()}"
         confidence_text = f"{confidence:.1%}"
         
         # Use fancy font
-        font = fonts.get('fancy', ImageFont.load_default())
-        small_font = fonts.get('default', ImageFont.load_default())
-        
-        # Calculate text dimensions
-        label_bbox = draw.textbbox((0, 0), label_text, font=font)
-        conf_bbox = draw.textbbox((0, 0), confidence_text, font=small_font)
-        
-        label_w = label_bbox[2] - label_bbox[0]
-        label_h = label_bbox[3] - label_bbox[1]
-        conf_w = conf_bbox[2] - conf_bbox[0]
-        conf_h = conf_bbox[3] - conf_bbox[1]
-        
-        # Position above the face
-        total_height = label_h + conf_h + 10
-        text_x = x + (w_box - max(label_w, conf_w)) // 2
-        text_y = y - total_height - 20
-        
-        # Draw glassmorphism background
-        padding = 15
-        bg_x = text_x - padding
-        bg_y = text_y - padding
-        bg_w = max(label_w, conf_w) + 2 * padding
-        bg_h = total_height + 2 * padding
+        font = fonts.get('fancy') or get_font('fancy', 24)
+        small_font = fonts.get('default') or get_font('default', 24)
         
-        # Create rounded rectangle with gradient
+        # Render just the label panel and composite it, instead of round-tripping the whole frame
         bg_color = tuple(int(c * 0.8) for c in color_scheme['primary'])
-        draw.rounded_rectangle(
-            [bg_x, bg_y, bg_x + bg_w, bg_y + bg_h],
-            radius=12, fill=(*bg_color, 180)
+        sprite, text_w, total_height, padding = _render_label_sprite(
+            label_text, confidence_text, bg_color, font, small_font
         )
         
-        # Draw text with shadow effect
-        shadow_offset = 2
-        # Shadow
-        draw.text((text_x + shadow_offset, text_y + shadow_offset), label_text, 
-                 font=font, fill=(0, 0, 0, 128))
-        # Main text
-        draw.text((text_x, text_y), label_text, font=font, fill=(255, 255, 255, 255))
-        
-        # Confidence text
-        conf_x = text_x + (label_w - conf_w) // 2
-        conf_y = text_y + label_h + 5
-        draw.text((conf_x + shadow_offset, conf_y + shadow_offset), confidence_text,
-                 font=small_font, fill=(0, 0, 0, 128))
-        draw.text((conf_x, conf_y), confidence_text, font=small_font, fill=(255, 255, 255, 255))
-        
-        # Convert back to OpenCV
-        overlay[:] = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+        # Position above the face
+        text_x = x + (w_box - text_w) // 2
+        text_y = y - total_height - 20
+        self._alpha_blit(overlay, sprite, text_x - padding, text_y - padding)
     
     def draw_emotion_history_graph(self, overlay: np.ndarray, x: int, y: int, 
                                   width: int, height: int, emotion_history: deque) -> None:
@@ -237,40 +432,39 @@ class ModernUIElements:
         border_color = (60 + int(20 * border_pulse), 60 + int(20 * border_pulse), 60 + int(20 * border_pulse))
         cv2.rectangle(overlay, (x, y), (x + width, y + height), border_color, 1)
         
-        # Plot animated points with emotion colors
-        points = []
-        colors = []
-        for i, entry in enumerate(emotion_history):
-            px = x + int((i / len(emotion_history)) * width)
-            py = y + height - int(entry['confidence'] * height)
-            points.append((px, py))
-            
-            # Get emotion color
-            emotion_color = COLOR_MAP.get(entry['emotion'], COLOR_MAP['neutral'])['primary']
-            colors.append(emotion_color)
-        
-        # Draw flowing lines with gradient effect
-        for i in range(1, len(points)):
-            # Animate the line thickness based on time and position
-            wave = self.animation_manager.create_wave_animation(points[i][0], points[i][1], i * 0.1, 0.3)
-            thickness = max(1, int(2 + wave))
-            
-            # Use color of current point
-            line_color = colors[i]
-            cv2.line(overlay, points[i-1], points[i], line_color, thickness)
-        
-        # Draw animated point markers
-        for i, (point, color) in enumerate(zip(points, colors)):
-            # Animate point size
-            point_pulse = self.animation_manager.create_pulse_animation(2.0 + i * 0.1, 0.4)
-            radius = max(2, int(3 + point_pulse))
+        # Plot points with emotion colors, computed for the whole history at once
+        n = len(emotion_history)
+        confs = np.fromiter((entry['confidence'] for entry in emotion_history), dtype=np.float32, count=n)
+        xs = x + (np.arange(n) * width) // n
+        ys = y + height - (confs * height).astype(np.int64)
+        pts = np.stack((xs, ys), axis=1).astype(np.int32)
+        neutral = COLOR_MAP['neutral']
+        colors = [COLOR_MAP.get(entry['emotion'], neutral)['primary'] for entry in emotion_history]
+        
+        # Line thickness animated by time and position; segment i ends at point i
+        waves = self.animation_manager.create_wave_field(xs[1:], ys[1:], np.arange(1, n) * 0.1, 0.3)
+        thickness = np.maximum(1, (2 + waves).astype(np.int32)).tolist()
+        
+        # Draw flowing lines, one polyline per run of same-color, same-thickness segments
+        start = 1
+        for i in range(2, n + 1):
+            if i == n or colors[i] != colors[start] or thickness[i - 1] != thickness[start - 1]:
+                cv2.polylines(overlay, [pts[start - 1:i]], False, colors[start], thickness[start - 1])
+                start = i
+        
+        points = list(map(tuple, pts.tolist()))
+        
+        # Draw animated point markers, sizes pulsing with a per-point period
+        pulses = self.animation_manager.vec_pulse(2.0 + np.arange(n) * 0.1, 0.4)
+        radii = np.maximum(2, (3 + pulses).astype(np.int32)).tolist()
+        first_glow = max(0, n - 5)
+        glow_colors = (np.asarray(colors[first_glow:]) * 0.3).astype(np.int32).tolist()
+        for i, (point, color, radius) in enumerate(zip(points, colors, radii)):
             cv2.circle(overlay, point, radius, color, -1)
             
             # Add subtle glow around recent points
-            if i >= len(points) - 5:  # Last 5 points
-                glow_radius = radius + 2
-                glow_color = tuple(int(c * 0.3) for c in color)
-                cv2.circle(overlay, point, glow_radius, glow_color, 1)
+            if i >= first_glow:  # Last 5 points
+                cv2.circle(overlay, point, radius + 2, glow_colors[i - first_glow], 1)
     
     def draw_enhanced_compliment(self, overlay: np.ndarray, w: int, h: int, 
                                compliment_text: str, fonts: Dict) -> None:
@@ -278,78 +472,19 @@ class ModernUIElements:
         if not compliment_text:
             return
             
-        # Convert to PIL for better text handling
-        pil_img = Image.fromarray(cv2.cvtColor(overlay, cv2.COLOR_BGR2RGB))
-        draw = ImageDraw.Draw(pil_img)
-        
         # Use fancy font
-        font = fonts.get('fancy', ImageFont.load_default())
-        
-        # Calculate text dimensions
-        lines = compliment_text.split('\n')
-        line_heights = []
-        line_widths = []
-        
-        for line in lines:
-            bbox = draw.textbbox((0, 0), line, font=font)
-            line_widths.append(bbox[2] - bbox[0])
-            line_heights.append(bbox[3] - bbox[1])
+        font = fonts.get('fancy') or get_font('fancy', 24)
         
-        max_width = max(line_widths)
-        total_height = sum(line_heights) + (len(lines) - 1) * 5
+        # Panel and text are rendered once per compliment; per frame only the position moves
+        sprite, max_width, total_height, margin = _render_compliment_sprite(compliment_text, font)
         
         # Position
         x = (w - max_width) // 2
         y = h - total_height - 80
         
-        # Enhanced animated background with multiple effects
-        breath = self.animation_manager.create_breath_animation(5.0)
-        pulse = self.animation_manager.create_pulse_animation(3.0, 0.4)
-        wave = self.animation_manager.create_wave_animation(x, y, 0, 0.2)
-        
-        # Combine animations for richer effect
-        bg_alpha = int(150 + 30 * breath + 20 * pulse + 10 * wave)
-        
         # Add floating effect to compliment position
         floating_y = self.animation_manager.create_floating_animation(y, 5, 4.0)
-        
-        # Draw enhanced glassmorphism background with floating effect
-        padding = 20
-        bg_y = floating_y - padding
-        
-        # Multi-layer background for depth
-        for layer in range(3):
-            layer_alpha = bg_alpha // (layer + 1)
-            layer_radius = 25 + layer * 2
-            layer_offset = layer * 2
-            
-            draw.rounded_rectangle(
-                [x - padding - layer_offset, bg_y - layer_offset, 
-                 x + max_width + padding + layer_offset, floating_y + total_height + padding + layer_offset],
-                radius=layer_radius, fill=(30 + layer * 10, 35 + layer * 10, 50 + layer * 10, layer_alpha)
-            )
-        
-        # Draw text lines with floating effect and enhanced shadows
-        current_y = floating_y
-        for i, line in enumerate(lines):
-            line_x = x + (max_width - line_widths[i]) // 2
-            
-            # Animated text glow
-            text_pulse = self.animation_manager.create_pulse_animation(2.5 + i * 0.2, 0.3)
-            text_alpha = int(255 * (0.9 + 0.1 * text_pulse))
-            
-            # Enhanced shadow with multiple layers
-            for shadow_offset in range(3, 0, -1):
-                shadow_alpha = 40 * (4 - shadow_offset)
-                draw.text((line_x + shadow_offset, current_y + shadow_offset), line, 
-                         font=font, fill=(0, 0, 0, shadow_alpha))
-            
-            # Main text with animated glow
-            draw.text((line_x, current_y), line, font=font, fill=(255, 255, 255, text_alpha))
-            current_y += line_heights[i] + 5
-        
-        # Convert back
-        overlay[:] = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+        self._alpha_blit(overlay, sprite, x - margin, floating_y - margin)
     
     def draw_fps_indicator(self, overlay: np.ndarray, fps: float, x: int, y: int) -> None:
         """Draw FPS indicator with color coding"""
@@ -361,9 +496,7 @@ class ModernUIElements:
         """Draw animated app title"""
         # Add subtle glow effect to title
         title_pulse = self.animation_manager.create_pulse_animation(4.0, 0.3)
-        title_alpha = int(255 * (0.8 + 0.2 * title_pulse))
+        title_alpha = 0.8 + 0.2 * title_pulse
         
-        cv2.putText(overlay, "MoodLyft Mirror", (x, y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
-        cv2.putText(overlay, "Real-time Emotion Analysis", (x, y + 25), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (180, 180, 180), 1) 
\ No newline at end of file
+        sprite, ox, oy = _render_title_sprite()
+        self._alpha_blit(overlay, sprite, x - ox, y - oy, title_alpha)
@@ -1,12 +1,14 @@
+import math
 import os
 import platform
+from functools import lru_cache
 import cv2
 import numpy as np
 from typing import Dict, Optional, Tuple
 from PIL import ImageFont
 import logging
 
-from .config import FONT_PATHS
+from .config import FONT_PATHS, BORDER_GLOW, BORDER_WAVE, BORDER_PULSE
 
 
 def get_system_info() -> Dict[str, str]:
@@ -22,33 +24,32 @@ def get_system_info() -> Dict[str, str]:
     }
 
 
+@lru_cache(maxsize=16)
+def _resolve_font_path(system: str, style: str) -> Optional[str]:
+    """Find the first existing font file for a platform and font style"""
+    font_configs = FONT_PATHS.get(system, FONT_PATHS['Linux'])
+    for font_path in font_configs.get(style, []):
+        if os.path.exists(font_path):
+            return font_path
+    return None
+
+
+@lru_cache(maxsize=16)
+def get_font(style: str, size: int) -> ImageFont.ImageFont:
+    """Load (once) the font for a style and size, falling back to PIL's default font"""
+    font_path = _resolve_font_path(platform.system(), style)
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except (OSError, IOError):
+            pass
+    return ImageFont.load_default()
+
+
 def load_fonts(size: int = 24) -> Dict[str, ImageFont.ImageFont]:
     """Load system fonts with fallbacks"""
-    fonts = {}
-    system = platform.system()
-    
-    font_configs = FONT_PATHS.get(system, FONT_PATHS['Linux'])
-    
-    # Try to load fonts for each category
-    for category, paths in font_configs.items():
-        font_loaded = False
-        for font_path in paths:
-            try:
-                if os.path.exists(font_path):
-                    fonts[category] = ImageFont.truetype(font_path, size)
-                    font_loaded = True
-                    break
-            except (OSError, IOError):
-                continue
-        
-        # Fallback to default font if none loaded
-        if not font_loaded:
-            try:
-                fonts[category] = ImageFont.load_default()
-            except:
-                fonts[category] = ImageFont.load_default()
-    
-    return fonts
+    font_configs = FONT_PATHS.get(platform.system(), FONT_PATHS['Linux'])
+    return {category: get_font(category, size) for category in font_configs}
 
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
@@ -63,7 +64,7 @@ def lerp(a: float, b: float, t: float) -> float:
 
 def distance_2d(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
     """Calculate Euclidean distance between two 2D points"""
-    return np.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
+    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
 
 
 def normalize_color(color: Tuple[int, int, int]) -> Tuple[float, float, float]:
@@ -104,18 +105,20 @@ def create_directory_if_not_exists(directory: str) -> bool:
         return False
 
 
-def get_border_style_for_emotion(emotion: str) -> str:
-    """Get appropriate border animation style for emotion"""
-    style_map = {
-        "happy": "pulse",
-        "surprise": "pulse", 
-        "sad": "wave",
-        "fear": "wave",
-        "angry": "glow",
-        "disgust": "glow",
-        "neutral": "glow"
-    }
-    return style_map.get(emotion, "glow")
+_BORDER_STYLES = {
+    "happy": BORDER_PULSE,
+    "surprise": BORDER_PULSE,
+    "sad": BORDER_WAVE,
+    "fear": BORDER_WAVE,
+    "angry": BORDER_GLOW,
+    "disgust": BORDER_GLOW,
+    "neutral": BORDER_GLOW
+}
+
+
+def get_border_style_for_emotion(emotion: str) -> int:
+    """Get appropriate border animation style id (config.BORDER_*) for emotion"""
+    return _BORDER_STYLES.get(emotion, BORDER_GLOW)
 
 
 def format_confidence(confidence: float) -> str: